@@ -6,6 +6,8 @@ This agent orchestrates the contract review process:
 3. Generate recommendations for improvements
 """
 
+from functools import lru_cache
+
 import structlog
 from langgraph.graph import END, StateGraph
 
@@ -43,9 +45,13 @@ def should_continue(state: ContractReviewState) -> str:
         return "extract"
 
 
+@lru_cache
 def create_contract_review_graph() -> StateGraph:
     """Create the contract review workflow graph.
 
+    The compiled graph is immutable, so it is built once and reused; call
+    ``create_contract_review_graph.cache_clear()`` to force a fresh build.
+
     Returns:
         Compiled LangGraph StateGraph
     """
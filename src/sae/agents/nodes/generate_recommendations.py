@@ -55,9 +55,14 @@ Respond with a JSON array. Each recommendation should have:
 Be practical and business-focused. Recommendations should be actionable.
 """
 
+# Set to inject an LLM instead of building a ChatOpenAI client (used by tests)
+_llm_override: ChatOpenAI | None = None
+
 
 def get_llm() -> ChatOpenAI:
-    """Get configured LLM instance."""
+    """Get configured LLM instance, or the injected override if one is set."""
+    if _llm_override is not None:
+        return _llm_override
     settings = get_settings()
     return ChatOpenAI(
         model="gpt-4o",
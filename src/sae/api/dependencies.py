@@ -1,4 +1,4 @@
-"""API dependencies for authentication and authorization."""
+"""API dependencies for authentication, authorization and shared services."""
 
 import secrets
 from typing import Annotated
@@ -7,6 +7,7 @@ import structlog
 from fastapi import Depends, Header, HTTPException, Request, status
 
 from sae.config import Settings, get_settings
+from sae.services.task_manager import TaskManager, get_task_manager
 
 logger = structlog.get_logger()
 
@@ -76,5 +77,6 @@ async def verify_api_key(
     return x_api_key
 
 
-# Type alias for use in route dependencies
+# Type aliases for use in route dependencies
 ApiKeyDep = Annotated[str | None, Depends(verify_api_key)]
+TaskManagerDep = Annotated[TaskManager, Depends(get_task_manager)]
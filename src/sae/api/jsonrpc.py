@@ -17,7 +17,7 @@ from slowapi.util import get_remote_address
 
 from sae.agents.contract_review import run_contract_review
 from sae.agents.state import ContractInput
-from sae.api.dependencies import ApiKeyDep
+from sae.api.dependencies import ApiKeyDep, TaskManagerDep
 from sae.config import get_settings
 from sae.models.a2a import (
     Artifact,
@@ -38,8 +38,8 @@ from sae.services.document_parser import (
 )
 from sae.services.task_manager import (
     InvalidStateTransitionError,
+    TaskManager,
     TaskNotFoundError,
-    get_task_manager,
 )
 
 logger = structlog.get_logger()
@@ -83,6 +83,7 @@ def make_success_response(
 async def handle_tasks_send(
     params: dict[str, Any],
     background_tasks: BackgroundTasks,
+    task_manager: TaskManager,
 ) -> dict[str, Any]:
     """Handle tasks/send method.
 
@@ -93,8 +94,6 @@ async def handle_tasks_send(
     except ValidationError as e:
         raise ValueError(f"Invalid parameters: {e}")
 
-    task_manager = get_task_manager()
-
     # Create or get task
     task = await task_manager.create_task(
         message=send_params.message,
@@ -103,7 +102,7 @@ async def handle_tasks_send(
     )
 
     # Start processing in background
-    background_tasks.add_task(process_task, task.id)
+    background_tasks.add_task(process_task, task.id, task_manager)
 
     return {
         "id": task.id,
@@ -114,7 +113,10 @@ async def handle_tasks_send(
     }
 
 
-async def handle_tasks_get(params: dict[str, Any]) -> dict[str, Any]:
+async def handle_tasks_get(
+    params: dict[str, Any],
+    task_manager: TaskManager,
+) -> dict[str, Any]:
     """Handle tasks/get method.
 
     Returns the current status of a task.
@@ -124,7 +126,6 @@ async def handle_tasks_get(params: dict[str, Any]) -> dict[str, Any]:
     except ValidationError as e:
         raise ValueError(f"Invalid parameters: {e}")
 
-    task_manager = get_task_manager()
     task = await task_manager.get_task(get_params.id)
 
     result = {
@@ -158,7 +159,10 @@ async def handle_tasks_get(params: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
-async def handle_tasks_cancel(params: dict[str, Any]) -> dict[str, Any]:
+async def handle_tasks_cancel(
+    params: dict[str, Any],
+    task_manager: TaskManager,
+) -> dict[str, Any]:
     """Handle tasks/cancel method.
 
     Cancels a running task.
@@ -168,7 +172,6 @@ async def handle_tasks_cancel(params: dict[str, Any]) -> dict[str, Any]:
     except ValidationError as e:
         raise ValueError(f"Invalid parameters: {e}")
 
-    task_manager = get_task_manager()
     task = await task_manager.cancel_task(cancel_params.id)
 
     return {
@@ -180,10 +183,8 @@ async def handle_tasks_cancel(params: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-async def process_task(task_id: str) -> None:
+async def process_task(task_id: str, task_manager: TaskManager) -> None:
     """Process a task in the background using the LangGraph agent."""
-    task_manager = get_task_manager()
-
     try:
         # Transition to working
         await task_manager.update_status(task_id, TaskState.WORKING)
@@ -312,6 +313,7 @@ async def handle_jsonrpc(
     request: Request,
     background_tasks: BackgroundTasks,
     api_key: ApiKeyDep,
+    task_manager: TaskManagerDep,
 ) -> dict:
     """Handle A2A JSON-RPC requests.
 
@@ -355,9 +357,9 @@ async def handle_jsonrpc(
     # Execute method
     try:
         if rpc_request.method == "tasks/send":
-            result = await handler(rpc_request.params, background_tasks)
+            result = await handler(rpc_request.params, background_tasks, task_manager)
         else:
-            result = await handler(rpc_request.params)
+            result = await handler(rpc_request.params, task_manager)
 
         return make_success_response(
             rpc_request.id,
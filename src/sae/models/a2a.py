@@ -5,9 +5,9 @@ Based on the A2A specification: https://google.github.io/A2A/specification/
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Discriminator, Field, Tag
 
 
 # =============================================================================
@@ -92,7 +92,23 @@ class DataPart(BaseModel):
     data: dict[str, Any]
 
 
-Part = TextPart | FilePart | DataPart
+def _part_type(value: Any) -> str | None:
+    """Return the ``type`` tag of a part, inferring it from the payload key if absent."""
+    if isinstance(value, dict):
+        tag = value.get("type")
+        if tag is None:
+            tag = next((key for key in ("text", "file", "data") if key in value), None)
+        return tag
+    return getattr(value, "type", None)
+
+
+# Dispatch on the tag instead of trying each part model in turn.
+Part = Annotated[
+    Annotated[TextPart, Tag("text")]
+    | Annotated[FilePart, Tag("file")]
+    | Annotated[DataPart, Tag("data")],
+    Discriminator(_part_type),
+]
 
 
 class Message(BaseModel):
@@ -5,8 +5,10 @@ For MVP, uses in-memory storage. Can be upgraded to Redis later.
 """
 
 import asyncio
-from collections.abc import AsyncIterator
-from datetime import datetime
+from collections.abc import AsyncIterator, Mapping, Sequence
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import Any
 from uuid import uuid4
 
@@ -25,6 +27,15 @@ from sae.models.a2a import (
 logger = structlog.get_logger()
 
 
+def _utcnow() -> datetime:
+    """Return the current UTC time for task status timestamps (patched in tests).
+
+    Timestamps stay naive, as datetime.utcnow() returned, so the serialized
+    status keeps its existing format.
+    """
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 class TaskNotFoundError(Exception):
     """Raised when a task is not found."""
 
@@ -37,20 +48,29 @@ class InvalidStateTransitionError(Exception):
     pass
 
 
-# Valid state transitions
-VALID_TRANSITIONS: dict[TaskState, set[TaskState]] = {
-    TaskState.SUBMITTED: {TaskState.WORKING, TaskState.CANCELED, TaskState.FAILED},
-    TaskState.WORKING: {
-        TaskState.COMPLETED,
-        TaskState.FAILED,
-        TaskState.CANCELED,
-        TaskState.INPUT_REQUIRED,
-    },
-    TaskState.INPUT_REQUIRED: {TaskState.WORKING, TaskState.CANCELED, TaskState.FAILED},
-    TaskState.COMPLETED: set(),  # Terminal state
-    TaskState.FAILED: set(),  # Terminal state
-    TaskState.CANCELED: set(),  # Terminal state
-}
+# Number of locks that task ids are spread over
+_LOCK_SHARDS = 16
+
+# Valid state transitions (read-only so callers cannot change the state machine)
+VALID_TRANSITIONS: Mapping[TaskState, frozenset[TaskState]] = MappingProxyType(
+    {
+        TaskState.SUBMITTED: frozenset({TaskState.WORKING, TaskState.CANCELED, TaskState.FAILED}),
+        TaskState.WORKING: frozenset(
+            {
+                TaskState.COMPLETED,
+                TaskState.FAILED,
+                TaskState.CANCELED,
+                TaskState.INPUT_REQUIRED,
+            }
+        ),
+        TaskState.INPUT_REQUIRED: frozenset(
+            {TaskState.WORKING, TaskState.CANCELED, TaskState.FAILED}
+        ),
+        TaskState.COMPLETED: frozenset(),  # Terminal state
+        TaskState.FAILED: frozenset(),  # Terminal state
+        TaskState.CANCELED: frozenset(),  # Terminal state
+    }
+)
 
 
 class TaskManager:
@@ -60,7 +80,20 @@ class TaskManager:
         """Initialize the task manager."""
         self._tasks: dict[str, Task] = {}
         self._subscribers: dict[str, list[asyncio.Queue[TaskResult]]] = {}
-        self._lock = asyncio.Lock()
+        # Per-task operations only serialize with tasks that share their shard
+        self._locks = [asyncio.Lock() for _ in range(_LOCK_SHARDS)]
+
+    def _lock_for(self, task_id: str) -> asyncio.Lock:
+        """Return the lock guarding the given task."""
+        return self._locks[hash(task_id) % _LOCK_SHARDS]
+
+    @asynccontextmanager
+    async def _all_locks(self) -> AsyncIterator[None]:
+        """Hold every shard lock, always acquired in the same order."""
+        async with AsyncExitStack() as stack:
+            for lock in self._locks:
+                await stack.enter_async_context(lock)
+            yield
 
     async def create_task(
         self,
@@ -78,31 +111,61 @@ class TaskManager:
         Returns:
             The created task
         """
-        async with self._lock:
-            if task_id is None:
-                task_id = str(uuid4())
-
-            if task_id in self._tasks:
-                # Task already exists, add message to history
-                existing_task = self._tasks[task_id]
-                existing_task.history.append(message)
-                return existing_task
-
-            task = Task(
-                id=task_id,
-                status=TaskStatus(
-                    state=TaskState.SUBMITTED,
-                    timestamp=datetime.utcnow(),
-                ),
-                history=[message],
-                metadata=metadata or {},
-            )
+        if task_id is None:
+            task_id = str(uuid4())
 
-            self._tasks[task_id] = task
-            self._subscribers[task_id] = []
+        async with self._lock_for(task_id):
+            return self._create_task_unlocked(message, task_id, metadata)
 
-            logger.info("Task created", task_id=task_id)
-            return task
+    async def bulk_create(self, items: Sequence[tuple[str, Message]]) -> list[Task]:
+        """Create several tasks while holding the locks once.
+
+        A setup helper for seeding a manager, not part of the request-handling
+        API. It takes every shard lock, so it blocks all other task operations
+        until it returns. Metadata is not supported; each new task gets an
+        empty metadata dict.
+
+        Args:
+            items: (task_id, message) pairs; an existing task_id gets the
+                message appended to its history, as with create_task
+
+        Returns:
+            The created (or existing) tasks, in the order given
+        """
+        async with self._all_locks():
+            return [self._create_task_unlocked(message, task_id) for task_id, message in items]
+
+    def _create_task_unlocked(
+        self,
+        message: Message,
+        task_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> Task:
+        """Create a task without taking its lock; callers must hold the task's lock."""
+        if task_id is None:
+            task_id = str(uuid4())
+
+        if task_id in self._tasks:
+            # Task already exists, add message to history
+            existing_task = self._tasks[task_id]
+            existing_task.history.append(message)
+            return existing_task
+
+        task = Task(
+            id=task_id,
+            status=TaskStatus(
+                state=TaskState.SUBMITTED,
+                timestamp=_utcnow(),
+            ),
+            history=[message],
+            metadata=metadata or {},
+        )
+
+        self._tasks[task_id] = task
+        self._subscribers[task_id] = []
+
+        logger.info("Task created", task_id=task_id)
+        return task
 
     async def get_task(self, task_id: str) -> Task:
         """Get a task by ID.
@@ -140,15 +203,15 @@ class TaskManager:
             TaskNotFoundError: If task is not found
             InvalidStateTransitionError: If transition is invalid
         """
-        async with self._lock:
+        async with self._lock_for(task_id):
             if task_id not in self._tasks:
                 raise TaskNotFoundError(f"Task {task_id} not found")
 
             task = self._tasks[task_id]
             current_state = task.status.state
 
-            # Validate state transition
-            if state not in VALID_TRANSITIONS.get(current_state, set()):
+            # Validate state transition (every TaskState has an entry)
+            if state not in VALID_TRANSITIONS[current_state]:
                 raise InvalidStateTransitionError(
                     f"Cannot transition from {current_state} to {state}"
                 )
@@ -156,7 +219,7 @@ class TaskManager:
             task.status = TaskStatus(
                 state=state,
                 message=message,
-                timestamp=datetime.utcnow(),
+                timestamp=_utcnow(),
             )
 
             if message:
@@ -188,7 +251,7 @@ class TaskManager:
         Returns:
             The updated task
         """
-        async with self._lock:
+        async with self._lock_for(task_id):
             if task_id not in self._tasks:
                 raise TaskNotFoundError(f"Task {task_id} not found")
 
@@ -273,7 +336,7 @@ class TaskManager:
 
         queue: asyncio.Queue[TaskResult] = asyncio.Queue()
 
-        async with self._lock:
+        async with self._lock_for(task_id):
             self._subscribers[task_id].append(queue)
 
         try:
@@ -293,7 +356,7 @@ class TaskManager:
                 }:
                     break
         finally:
-            async with self._lock:
+            async with self._lock_for(task_id):
                 if task_id in self._subscribers:
                     self._subscribers[task_id].remove(queue)
 
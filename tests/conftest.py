@@ -1,8 +1,10 @@
 """Global test fixtures for the Sae Legal Agent test suite."""
 
 import asyncio
-from collections.abc import AsyncIterator, Iterator
+import copy
+from collections.abc import AsyncIterator, Callable, Iterator
 from datetime import datetime
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -27,6 +29,7 @@ from sae.models.clauses import (
 )
 from sae.services.task_manager import TaskManager
 
+from .fixtures.models import freeze
 from .fixtures.sample_contracts import SIMPLE_NDA
 from .fixtures.mock_llm_responses import (
     MOCK_CLAUSE_EXTRACTION_JSON,
@@ -35,30 +38,21 @@ from .fixtures.mock_llm_responses import (
 )
 
 
-# =============================================================================
-# Event Loop Fixture
-# =============================================================================
-
-
-@pytest.fixture(scope="session")
-def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
-    """Create an event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
 # =============================================================================
 # Settings Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def mock_settings() -> Iterator[MagicMock]:
+@pytest.fixture(scope="session")
+def mock_settings() -> Iterator[SimpleNamespace]:
     """Create mock settings for testing.
 
-    This fixture patches the get_settings function to return a mock settings
+    This fixture patches the get_settings function to return a stand-in settings
     object with test values, avoiding the need for actual environment variables.
+    A plain namespace is enough here: tests only read attributes, so there is no
+    need to introspect the Settings model for a spec. The object is shared across
+    the session, so tests must not mutate it; request mutable_settings for a
+    per-test copy instead.
     """
     from sae.config import get_settings
 
@@ -66,22 +60,23 @@ def mock_settings() -> Iterator[MagicMock]:
     get_settings.cache_clear()
 
     with patch("sae.config.get_settings") as mock_get_settings:
-        settings = MagicMock()
-        settings.openai_api_key = "test-openai-api-key"
-        settings.pinecone_api_key = None  # Optional - not required
-        settings.pinecone_index_name = "test-index"
-        settings.api_key = None  # Auth disabled by default
-        settings.rate_limit_enabled = False  # Disable for tests
-        settings.rate_limit_per_minute = 30
-        settings.cors_origins = ["*"]
-        settings.log_level = "DEBUG"
-        settings.environment = "development"
-        settings.host = "0.0.0.0"
-        settings.port = 8000
-        settings.agent_name = "Test Legal Agent"
-        settings.agent_version = "0.1.0-test"
-        settings.agent_description = "Test agent for contract review"
-        settings.is_production = False
+        settings = SimpleNamespace(
+            openai_api_key="test-openai-api-key",
+            pinecone_api_key=None,  # Optional - not required
+            pinecone_index_name="test-index",
+            api_key=None,  # Auth disabled by default
+            rate_limit_enabled=False,  # Disable for tests
+            rate_limit_per_minute=30,
+            cors_origins=["*"],
+            log_level="DEBUG",
+            environment="development",
+            host="0.0.0.0",
+            port=8000,
+            agent_name="Test Legal Agent",
+            agent_version="0.1.0-test",
+            agent_description="Test agent for contract review",
+            is_production=False,
+        )
 
         mock_get_settings.return_value = settings
         yield settings
@@ -90,6 +85,19 @@ def mock_settings() -> Iterator[MagicMock]:
     get_settings.cache_clear()
 
 
+@pytest.fixture
+def mutable_settings(
+    mock_settings: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> SimpleNamespace:
+    """Return a per-test copy of mock_settings that tests may modify.
+
+    The copy is also what sae.config.get_settings returns for the test.
+    """
+    settings = copy.copy(mock_settings)
+    monkeypatch.setattr("sae.config.get_settings", lambda: settings)
+    return settings
+
+
 @pytest.fixture
 def mock_production_settings() -> Iterator[MagicMock]:
     """Create mock settings for production environment testing."""
@@ -123,17 +131,40 @@ def mock_production_settings() -> Iterator[MagicMock]:
     get_settings.cache_clear()
 
 
+# =============================================================================
+# Event Loop Fixtures
+# =============================================================================
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop where it is installed (it ships with uvicorn[standard])."""
+    try:
+        import uvloop
+    except ImportError:  # uvloop is not built for Windows
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 # =============================================================================
 # Task Manager Fixtures
 # =============================================================================
 
 
-@pytest.fixture
-def task_manager() -> TaskManager:
-    """Create a fresh TaskManager instance for testing."""
+@pytest.fixture(scope="session")
+def shared_task_manager() -> TaskManager:
+    """Create the TaskManager instance reused by the task manager tests."""
     return TaskManager()
 
 
+@pytest.fixture
+def task_manager(shared_task_manager: TaskManager) -> TaskManager:
+    """Return the shared TaskManager with no tasks or subscribers left from earlier tests."""
+    shared_task_manager._tasks.clear()
+    shared_task_manager._subscribers.clear()
+    return shared_task_manager
+
+
 @pytest.fixture
 def mock_task_manager() -> Iterator[MagicMock]:
     """Create a mock TaskManager for API testing."""
@@ -227,15 +258,17 @@ def completed_task(sample_task: Task, sample_artifact: Artifact) -> Task:
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_clause() -> ExtractedClause:
-    """Create a sample extracted clause."""
-    return ExtractedClause(
-        id="clause-001",
-        type=ClauseType.LIABILITY,
-        title="Limitation of Liability",
-        text="The company shall not be liable for any indirect damages.",
-        location="Section 5.1",
+    """Create a sample extracted clause, shared read-only across the session."""
+    return freeze(
+        ExtractedClause(
+            id="clause-001",
+            type=ClauseType.LIABILITY,
+            title="Limitation of Liability",
+            text="The company shall not be liable for any indirect damages.",
+            location="Section 5.1",
+        )
     )
 
 
@@ -267,16 +300,18 @@ def sample_clauses() -> list[ExtractedClause]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_risk() -> RiskAssessment:
-    """Create a sample risk assessment."""
-    return RiskAssessment(
-        clause_id="clause-001",
-        risk_level=RiskLevel.HIGH,
-        confidence=0.85,
-        issues=["Unlimited liability exposure", "One-sided protection"],
-        explanation="This clause exposes the client to significant risk.",
-        affected_party="client",
+    """Create a sample risk assessment, shared read-only across the session."""
+    return freeze(
+        RiskAssessment(
+            clause_id="clause-001",
+            risk_level=RiskLevel.HIGH,
+            confidence=0.85,
+            issues=["Unlimited liability exposure", "One-sided protection"],
+            explanation="This clause exposes the client to significant risk.",
+            affected_party="client",
+        )
     )
 
 
@@ -311,16 +346,18 @@ def sample_risks() -> list[RiskAssessment]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_recommendation() -> Recommendation:
-    """Create a sample recommendation."""
-    return Recommendation(
-        clause_id="clause-001",
-        priority=1,
-        action="Add mutual liability cap",
-        rationale="Limits exposure for both parties.",
-        suggested_text="Total liability shall not exceed $5,000,000.",
-        risk_reduction=RiskLevel.MEDIUM,
+    """Create a sample recommendation, shared read-only across the session."""
+    return freeze(
+        Recommendation(
+            clause_id="clause-001",
+            priority=1,
+            action="Add mutual liability cap",
+            rationale="Limits exposure for both parties.",
+            suggested_text="Total liability shall not exceed $5,000,000.",
+            risk_reduction=RiskLevel.MEDIUM,
+        )
     )
 
 
@@ -414,21 +451,40 @@ def mock_all_llms(
 # =============================================================================
 
 
-@pytest.fixture
-def app(mock_settings: MagicMock) -> Any:
+@pytest.fixture(scope="session")
+def app(mock_settings: SimpleNamespace) -> Any:
     """Create a test FastAPI application.
 
-    Note: Must import after mock_settings is applied to avoid
-    loading real environment variables.
+    The app is built under mock_settings rather than reusing sae.main.app,
+    which captures whatever settings were active when the module was first
+    imported.
     """
-    from sae.main import app
-    return app
+    from sae.main import create_app
+
+    with patch("sae.main.get_settings", return_value=mock_settings):
+        return create_app()
 
 
 @pytest.fixture
-def client(app: Any) -> TestClient:
-    """Create a synchronous test client."""
-    return TestClient(app)
+def override_task_manager(app: Any) -> Iterator[Callable[[Any], None]]:
+    """Return a setter that overrides the app's task manager dependency.
+
+    The override is removed on teardown so the shared app stays clean.
+    """
+    from sae.services.task_manager import get_task_manager
+
+    def _override(manager: Any) -> None:
+        app.dependency_overrides[get_task_manager] = lambda: manager
+
+    yield _override
+    app.dependency_overrides.pop(get_task_manager, None)
+
+
+@pytest.fixture(scope="session")
+def client(app: Any) -> Iterator[TestClient]:
+    """Create a synchronous test client shared by the whole session."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 # =============================================================================
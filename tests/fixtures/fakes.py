@@ -0,0 +1,18 @@
+"""Lightweight fakes for async collaborators in tests."""
+
+from typing import Any
+
+
+class FakeAinvoke:
+    """Awaitable stand-in for an ``ainvoke`` method that records its calls."""
+
+    def __init__(self, result: Any = None) -> None:
+        self.result = result
+        self.error: Exception | None = None
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if self.error is not None:
+            raise self.error
+        return self.result
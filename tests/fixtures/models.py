@@ -0,0 +1,62 @@
+"""A2A model helpers for tests.
+
+The unvalidated builders are for tests where a model is only an input; tests of
+the models themselves should keep using the real constructors. freeze() guards
+shared fixture instances against accidental mutation.
+"""
+
+from functools import cache
+
+from pydantic import BaseModel, ConfigDict
+
+from sae.models.a2a import Message, TaskState, TaskStatus, TextPart
+
+
+@cache
+def _frozen_type[M: BaseModel](cls: type[M]) -> type[M]:
+    """Create (once per model) a subclass of cls that rejects attribute assignment.
+
+    Pydantic's __eq__ requires the exact same class, so the subclass compares
+    field values against cls instances instead; Python tries a subclass's
+    __eq__ first, so this holds for either operand order.
+    """
+
+    def _eq_by_fields(self: BaseModel, other: object) -> bool:
+        if isinstance(other, BaseModel) and type(other) in (cls, type(self)):
+            return (
+                self.__dict__ == other.__dict__
+                and self.__pydantic_extra__ == other.__pydantic_extra__
+            )
+        return NotImplemented
+
+    namespace = {"model_config": ConfigDict(frozen=True), "__eq__": _eq_by_fields}
+    return type(f"Frozen{cls.__name__}", (cls,), namespace)
+
+
+def freeze[M: BaseModel](obj: M) -> M:
+    """Return a shallow, frozen copy of obj that still passes isinstance checks.
+
+    The copy compares equal to an instance of the original model with the same
+    field values.
+
+    Assigning a field on the copy raises ValidationError. Nested lists and dicts
+    are shared with obj and stay mutable, so consumers must still not mutate them.
+    """
+    fields = {name: getattr(obj, name) for name in type(obj).model_fields}
+    return _frozen_type(type(obj)).model_construct(_fields_set=obj.model_fields_set, **fields)
+
+
+build_message = Message.model_construct
+
+
+def build_text_part(text: str) -> TextPart:
+    """Build a TextPart without running validation."""
+    return TextPart.model_construct(type="text", text=text)
+
+
+REPORT_CONTENT = freeze(build_text_part("Content"))
+
+# Shared statuses; each TaskStatus reads the clock, so build them once
+SUBMITTED_STATUS = freeze(TaskStatus(state=TaskState.SUBMITTED))
+WORKING_STATUS = freeze(TaskStatus(state=TaskState.WORKING))
+COMPLETED_STATUS = freeze(TaskStatus(state=TaskState.COMPLETED))
@@ -1,6 +1,7 @@
 """Sample file data for testing document parsing."""
 
 import base64
+from functools import cache
 
 # Minimal valid PDF (1 page with "Test Contract" text)
 # This is a minimal valid PDF structure
@@ -53,6 +54,19 @@ This agreement is valid for one year.
 SAMPLE_TXT_BYTES = SAMPLE_TXT_CONTENT.encode("utf-8")
 SAMPLE_TXT_BASE64 = base64.b64encode(SAMPLE_TXT_BYTES).decode()
 
+# Non-ASCII text samples for encoding tests
+SAMPLE_UNICODE_TEXT = "Contract with unicode: café résumé naïve"
+SAMPLE_UNICODE_BASE64 = base64.b64encode(SAMPLE_UNICODE_TEXT.encode("utf-8")).decode()
+# Text that's valid Latin-1 but not valid UTF-8
+SAMPLE_LATIN1_TEXT = "Contract with special chars: \xe9\xe8\xe0"
+SAMPLE_LATIN1_BASE64 = base64.b64encode(SAMPLE_LATIN1_TEXT.encode("latin-1")).decode()
+
+
+@cache
+def _data_uri(mime_type: str, data_base64: str) -> str:
+    """Build (once per MIME type and payload) the data URI for a file part."""
+    return f"data:{mime_type};base64,{data_base64}"
+
 
 def create_file_part(
     mime_type: str,
@@ -70,7 +84,7 @@ def create_file_part(
         Dictionary matching FilePart.file structure
     """
     return {
-        "uri": f"data:{mime_type};base64,{data_base64}",
+        "uri": _data_uri(mime_type, data_base64),
         "mimeType": mime_type,
         "name": name,
     }
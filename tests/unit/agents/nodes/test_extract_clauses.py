@@ -1,10 +1,12 @@
 """Tests for the extract_clauses node."""
 
+import importlib
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from sae.agents.nodes.extract_clauses import extract_clauses, get_llm
+from sae.agents.nodes.extract_clauses import extract_clauses
 from sae.agents.state import ContractReviewState
 from sae.models.clauses import ClauseType
 
@@ -19,52 +21,40 @@ from tests.fixtures.mock_llm_responses import (
 )
 from tests.fixtures.sample_contracts import SIMPLE_NDA
 
+# The nodes package re-exports each node function under its module name,
+# so resolve the module itself to patch its ChatOpenAI reference.
+ec_mod = importlib.import_module("sae.agents.nodes.extract_clauses")
+
+
+_BASE_STATE: ContractReviewState = {
+    "task_id": "test-task-001",
+    "contract_text": SIMPLE_NDA,
+    "contract_metadata": {},
+    "status": "extracting",
+    "error": None,
+    "clauses": [],
+    "risks": [],
+    "recommendations": [],
+    "messages": [],
+}
+
 
 def create_test_state(contract_text: str = SIMPLE_NDA) -> ContractReviewState:
     """Create a test state for clause extraction."""
-    return {
-        "task_id": "test-task-001",
-        "contract_text": contract_text,
-        "contract_metadata": {},
-        "status": "extracting",
-        "error": None,
-        "clauses": [],
-        "risks": [],
-        "recommendations": [],
-        "messages": [],
-    }
-
-
-class TestGetLlm:
-    """Tests for get_llm function."""
-
-    def test_get_llm_uses_gpt4o(self, mock_settings: MagicMock) -> None:
-        """Test that get_llm uses gpt-4o model."""
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
-            get_llm()
-            MockLLM.assert_called_once()
-            call_kwargs = MockLLM.call_args.kwargs
-            assert call_kwargs["model"] == "gpt-4o"
-            assert call_kwargs["temperature"] == 0
-
-    def test_get_llm_uses_api_key_from_settings(self, mock_settings: MagicMock) -> None:
-        """Test that get_llm uses API key from settings."""
-        with patch("sae.agents.nodes.extract_clauses.get_settings", return_value=mock_settings):
-            with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
-                get_llm()
-                call_kwargs = MockLLM.call_args.kwargs
-                assert call_kwargs["api_key"] == mock_settings.openai_api_key
+    state = _BASE_STATE.copy()
+    state["contract_text"] = contract_text
+    return state
 
 
 class TestExtractClauses:
     """Tests for extract_clauses function."""
 
-    async def test_extract_clauses_success(self, mock_settings: MagicMock) -> None:
+    async def test_extract_clauses_success(self, mock_settings: SimpleNamespace) -> None:
         """Test successful clause extraction."""
         mock_response = MagicMock()
         mock_response.content = MOCK_CLAUSE_EXTRACTION_JSON
 
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
+        with patch.object(ec_mod, "ChatOpenAI") as MockLLM:
             mock_llm = AsyncMock()
             mock_llm.ainvoke = AsyncMock(return_value=mock_response)
             MockLLM.return_value = mock_llm
@@ -79,13 +69,13 @@ class TestExtractClauses:
             assert result["clauses"][2].type == ClauseType.TERMINATION
 
     async def test_extract_clauses_parses_plain_json(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace
     ) -> None:
         """Test parsing plain JSON without markdown blocks."""
         mock_response = MagicMock()
         mock_response.content = MOCK_CLAUSE_EXTRACTION_PLAIN_JSON
 
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
+        with patch.object(ec_mod, "ChatOpenAI") as MockLLM:
             mock_llm = AsyncMock()
             mock_llm.ainvoke = AsyncMock(return_value=mock_response)
             MockLLM.return_value = mock_llm
@@ -97,13 +87,13 @@ class TestExtractClauses:
             assert len(result["clauses"]) == 1
 
     async def test_extract_clauses_handles_markdown_json(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace
     ) -> None:
         """Test handling JSON wrapped in markdown code blocks."""
         mock_response = MagicMock()
         mock_response.content = MOCK_NESTED_MARKDOWN_JSON
 
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
+        with patch.object(ec_mod, "ChatOpenAI") as MockLLM:
             mock_llm = AsyncMock()
             mock_llm.ainvoke = AsyncMock(return_value=mock_response)
             MockLLM.return_value = mock_llm
@@ -116,13 +106,13 @@ class TestExtractClauses:
             assert result["clauses"][0].type == ClauseType.WARRANTY
 
     async def test_extract_clauses_unknown_type_defaults_to_other(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace
     ) -> None:
         """Test that unknown clause types default to OTHER."""
         mock_response = MagicMock()
         mock_response.content = MOCK_UNKNOWN_CLAUSE_TYPE_JSON
 
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
+        with patch.object(ec_mod, "ChatOpenAI") as MockLLM:
             mock_llm = AsyncMock()
             mock_llm.ainvoke = AsyncMock(return_value=mock_response)
             MockLLM.return_value = mock_llm
@@ -133,12 +123,12 @@ class TestExtractClauses:
             assert result["status"] == "analyzing"
             assert result["clauses"][0].type == ClauseType.OTHER
 
-    async def test_extract_clauses_generates_ids(self, mock_settings: MagicMock) -> None:
+    async def test_extract_clauses_generates_ids(self, mock_settings: SimpleNamespace) -> None:
         """Test that clause IDs are generated."""
         mock_response = MagicMock()
         mock_response.content = MOCK_CLAUSE_EXTRACTION_PLAIN_JSON
 
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
+        with patch.object(ec_mod, "ChatOpenAI") as MockLLM:
             mock_llm = AsyncMock()
             mock_llm.ainvoke = AsyncMock(return_value=mock_response)
             MockLLM.return_value = mock_llm
@@ -150,13 +140,13 @@ class TestExtractClauses:
             assert len(result["clauses"][0].id) == 8
 
     async def test_extract_clauses_json_decode_error(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace
     ) -> None:
         """Test handling of JSON decode errors."""
         mock_response = MagicMock()
         mock_response.content = MOCK_MALFORMED_JSON
 
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
+        with patch.object(ec_mod, "ChatOpenAI") as MockLLM:
             mock_llm = AsyncMock()
             mock_llm.ainvoke = AsyncMock(return_value=mock_response)
             MockLLM.return_value = mock_llm
@@ -167,9 +157,9 @@ class TestExtractClauses:
             assert result["status"] == "failed"
             assert "Failed to parse extracted clauses" in result["error"]
 
-    async def test_extract_clauses_llm_exception(self, mock_settings: MagicMock) -> None:
+    async def test_extract_clauses_llm_exception(self, mock_settings: SimpleNamespace) -> None:
         """Test handling of LLM exceptions."""
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
+        with patch.object(ec_mod, "ChatOpenAI") as MockLLM:
             mock_llm = AsyncMock()
             mock_llm.ainvoke = AsyncMock(side_effect=Exception("API Error"))
             MockLLM.return_value = mock_llm
@@ -181,13 +171,13 @@ class TestExtractClauses:
             assert "Clause extraction error" in result["error"]
 
     async def test_extract_clauses_empty_response(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace
     ) -> None:
         """Test handling of empty clause array."""
         mock_response = MagicMock()
         mock_response.content = MOCK_EMPTY_CLAUSES_JSON
 
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
+        with patch.object(ec_mod, "ChatOpenAI") as MockLLM:
             mock_llm = AsyncMock()
             mock_llm.ainvoke = AsyncMock(return_value=mock_response)
             MockLLM.return_value = mock_llm
@@ -199,13 +189,13 @@ class TestExtractClauses:
             assert result["clauses"] == []
 
     async def test_extract_clauses_missing_fields_uses_defaults(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace
     ) -> None:
         """Test that missing fields use default values."""
         mock_response = MagicMock()
         mock_response.content = MOCK_MISSING_FIELDS_JSON
 
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
+        with patch.object(ec_mod, "ChatOpenAI") as MockLLM:
             mock_llm = AsyncMock()
             mock_llm.ainvoke = AsyncMock(return_value=mock_response)
             MockLLM.return_value = mock_llm
@@ -219,12 +209,12 @@ class TestExtractClauses:
             assert clause.text == ""  # Default text
             assert clause.location == "Section 1"  # Default location
 
-    async def test_extract_clauses_adds_message(self, mock_settings: MagicMock) -> None:
+    async def test_extract_clauses_adds_message(self, mock_settings: SimpleNamespace) -> None:
         """Test that extraction adds a message to the state."""
         mock_response = MagicMock()
         mock_response.content = MOCK_CLAUSE_EXTRACTION_JSON
 
-        with patch("sae.agents.nodes.extract_clauses.ChatOpenAI") as MockLLM:
+        with patch.object(ec_mod, "ChatOpenAI") as MockLLM:
             mock_llm = AsyncMock()
             mock_llm.ainvoke = AsyncMock(return_value=mock_response)
             MockLLM.return_value = mock_llm
@@ -0,0 +1,40 @@
+"""Tests for the get_llm helper shared by every agent node."""
+
+import importlib
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+NODE_MODULES = [
+    ("sae.agents.nodes.extract_clauses", 0),
+    ("sae.agents.nodes.analyze_risks", 0),
+    ("sae.agents.nodes.generate_recommendations", 0.1),
+]
+
+
+@pytest.mark.parametrize(("mod", "temperature"), NODE_MODULES)
+def test_get_llm_configuration(
+    mod: str, temperature: float, mock_settings: SimpleNamespace
+) -> None:
+    """Test that get_llm uses gpt-4o, the node's temperature and the settings API key."""
+    with patch(f"{mod}.get_settings", return_value=mock_settings):
+        with patch(f"{mod}.ChatOpenAI") as MockLLM:
+            importlib.import_module(mod).get_llm()
+
+            MockLLM.assert_called_once()
+            call_kwargs = MockLLM.call_args.kwargs
+            assert call_kwargs["model"] == "gpt-4o"
+            assert call_kwargs["temperature"] == temperature
+            assert call_kwargs["api_key"] == mock_settings.openai_api_key
+
+
+def test_get_llm_returns_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that get_llm returns the injected LLM without building a ChatOpenAI client."""
+    mod = importlib.import_module("sae.agents.nodes.generate_recommendations")
+    fake_llm = MagicMock()
+    monkeypatch.setattr(mod, "_llm_override", fake_llm)
+
+    with patch.object(mod, "ChatOpenAI") as MockLLM:
+        assert mod.get_llm() is fake_llm
+        MockLLM.assert_not_called()
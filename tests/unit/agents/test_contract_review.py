@@ -1,8 +1,10 @@
 """Tests for the contract review workflow."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import functools
+from types import SimpleNamespace
 
 import pytest
+from pydantic import TypeAdapter
 
 from sae.agents.contract_review import (
     create_contract_review_graph,
@@ -12,6 +14,24 @@ from sae.agents.contract_review import (
 from sae.agents.state import ContractInput, ContractReviewState
 from sae.models.clauses import ClauseType, ExtractedClause, RiskAssessment, RiskLevel
 
+from tests.fixtures.fakes import FakeAinvoke
+
+_CLAUSES_ADAPTER = TypeAdapter(list[ExtractedClause])
+_RISKS_ADAPTER = TypeAdapter(list[RiskAssessment])
+
+
+_BASE_STATE: ContractReviewState = {
+    "task_id": "test-task-001",
+    "contract_text": "Sample contract",
+    "contract_metadata": {},
+    "status": "pending",
+    "error": None,
+    "clauses": [],
+    "risks": [],
+    "recommendations": [],
+    "messages": [],
+}
+
 
 def create_test_state(
     status: str = "pending",
@@ -21,64 +41,43 @@ def create_test_state(
     error: str | None = None,
 ) -> ContractReviewState:
     """Create a test ContractReviewState."""
-    return {
-        "task_id": "test-task-001",
-        "contract_text": "Sample contract",
-        "contract_metadata": {},
-        "status": status,  # type: ignore
-        "error": error,
-        "clauses": clauses or [],
-        "risks": risks or [],
-        "recommendations": recommendations or [],
-        "messages": [],
-    }
+    state = _BASE_STATE.copy()
+    state["status"] = status  # type: ignore
+    state["error"] = error
+    if clauses is not None:
+        state["clauses"] = clauses
+    if risks is not None:
+        state["risks"] = risks
+    if recommendations is not None:
+        state["recommendations"] = recommendations
+    return state
+
+
+@functools.cache
+def make_input(task_id: str) -> ContractInput:
+    """Return a shared ContractInput for the given task ID."""
+    return ContractInput(task_id=task_id, contract_text="Sample contract text")
 
 
 class TestShouldContinue:
     """Tests for should_continue router function."""
 
-    def test_should_continue_failed_returns_end(self) -> None:
-        """Test that failed status returns 'end'."""
-        state = create_test_state(status="failed")
-        result = should_continue(state)
-        assert result == "end"
-
-    def test_should_continue_extracting_returns_extract(self) -> None:
-        """Test that extracting status returns 'extract'."""
-        state = create_test_state(status="extracting")
-        result = should_continue(state)
-        assert result == "extract"
-
-    def test_should_continue_analyzing_returns_analyze(self) -> None:
-        """Test that analyzing status returns 'analyze'."""
-        state = create_test_state(status="analyzing")
-        result = should_continue(state)
-        assert result == "analyze"
-
-    def test_should_continue_recommending_returns_recommend(self) -> None:
-        """Test that recommending status returns 'recommend'."""
-        state = create_test_state(status="recommending")
-        result = should_continue(state)
-        assert result == "recommend"
-
-    def test_should_continue_complete_returns_end(self) -> None:
-        """Test that complete status returns 'end'."""
-        state = create_test_state(status="complete")
-        result = should_continue(state)
-        assert result == "end"
-
-    def test_should_continue_pending_returns_extract(self) -> None:
-        """Test that pending (default) status returns 'extract'."""
-        state = create_test_state(status="pending")
-        result = should_continue(state)
-        assert result == "extract"
-
-    def test_should_continue_unknown_returns_extract(self) -> None:
-        """Test that unknown status returns 'extract' as default."""
-        state = create_test_state()
-        state["status"] = "unknown"  # type: ignore
-        result = should_continue(state)
-        assert result == "extract"
+    @pytest.mark.parametrize(
+        ("status", "expected"),
+        [
+            ("failed", "end"),
+            ("extracting", "extract"),
+            ("analyzing", "analyze"),
+            ("recommending", "recommend"),
+            ("complete", "end"),
+            ("pending", "extract"),
+            ("unknown", "extract"),
+        ],
+    )
+    def test_should_continue_routes_by_status(self, status: str, expected: str) -> None:
+        """Test that each status routes to the expected node, defaulting to 'extract'."""
+        state = create_test_state(status=status)
+        assert should_continue(state) == expected
 
 
 class TestCreateContractReviewGraph:
@@ -90,11 +89,28 @@ class TestCreateContractReviewGraph:
         # CompiledGraph should have ainvoke method
         assert hasattr(graph, "ainvoke")
 
+    def test_graph_is_cached(self) -> None:
+        """Test that repeated calls return the same compiled graph until the cache is cleared."""
+        graph = create_contract_review_graph()
+        assert create_contract_review_graph() is graph
+
+        create_contract_review_graph.cache_clear()
+        assert create_contract_review_graph() is not graph
+
 
 class TestRunContractReview:
     """Tests for run_contract_review function."""
 
-    async def test_run_contract_review_success(self, mock_settings: MagicMock) -> None:
+    @pytest.fixture(autouse=True)
+    def mock_graph(self, monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+        """Replace the compiled workflow graph with a fake for every test."""
+        graph = SimpleNamespace(ainvoke=FakeAinvoke())
+        monkeypatch.setattr("sae.agents.contract_review.contract_review_graph", graph)
+        return graph
+
+    async def test_run_contract_review_success(
+        self, mock_settings: SimpleNamespace, mock_graph: SimpleNamespace
+    ) -> None:
         """Test successful contract review run."""
         # Create sample output data
         sample_clauses = [
@@ -123,23 +139,18 @@ class TestRunContractReview:
             "error": None,
         }
 
-        with patch("sae.agents.contract_review.contract_review_graph") as mock_graph:
-            mock_graph.ainvoke = AsyncMock(return_value=mock_final_state)
+        mock_graph.ainvoke.result = mock_final_state
 
-            input_data = ContractInput(
-                task_id="test-001",
-                contract_text="Sample contract text",
-            )
-            result = await run_contract_review(input_data)
+        result = await run_contract_review(make_input("test-001"))
 
-            assert result.success is True
-            assert result.task_id == "test-001"
-            assert result.error is None
-            assert len(result.analysis.clauses) == 1
-            assert len(result.analysis.risks) == 1
+        assert result.success is True
+        assert result.task_id == "test-001"
+        assert result.error is None
+        assert len(result.analysis.clauses) == 1
+        assert len(result.analysis.risks) == 1
 
     async def test_run_contract_review_failed_state(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace, mock_graph: SimpleNamespace
     ) -> None:
         """Test contract review with failed state."""
         mock_final_state = {
@@ -150,94 +161,55 @@ class TestRunContractReview:
             "error": "Failed to parse JSON",
         }
 
-        with patch("sae.agents.contract_review.contract_review_graph") as mock_graph:
-            mock_graph.ainvoke = AsyncMock(return_value=mock_final_state)
+        mock_graph.ainvoke.result = mock_final_state
 
-            input_data = ContractInput(
-                task_id="test-002",
-                contract_text="Sample contract text",
-            )
-            result = await run_contract_review(input_data)
+        result = await run_contract_review(make_input("test-002"))
 
-            assert result.success is False
-            assert result.error == "Failed to parse JSON"
-            assert result.analysis.overall_risk == RiskLevel.HIGH
+        assert result.success is False
+        assert result.error == "Failed to parse JSON"
+        assert result.analysis.overall_risk == RiskLevel.HIGH
 
     async def test_run_contract_review_exception_handled(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace, mock_graph: SimpleNamespace
     ) -> None:
         """Test that exceptions are caught and returned as error."""
-        with patch("sae.agents.contract_review.contract_review_graph") as mock_graph:
-            mock_graph.ainvoke = AsyncMock(side_effect=Exception("Graph execution error"))
-
-            input_data = ContractInput(
-                task_id="test-003",
-                contract_text="Sample contract text",
-            )
-            result = await run_contract_review(input_data)
-
-            assert result.success is False
-            assert "Graph execution error" in result.error  # type: ignore
-            assert result.analysis.overall_risk == RiskLevel.HIGH
-
-    async def test_overall_risk_critical_if_any_critical(
-        self, mock_settings: MagicMock
+        mock_graph.ainvoke.error = Exception("Graph execution error")
+
+        result = await run_contract_review(make_input("test-003"))
+
+        assert result.success is False
+        assert "Graph execution error" in result.error  # type: ignore
+        assert result.analysis.overall_risk == RiskLevel.HIGH
+
+    @pytest.mark.parametrize(
+        ("levels", "expected"),
+        [
+            ([RiskLevel.LOW, RiskLevel.CRITICAL], RiskLevel.CRITICAL),
+            ([RiskLevel.LOW, RiskLevel.HIGH], RiskLevel.HIGH),
+            ([RiskLevel.LOW, RiskLevel.MEDIUM], RiskLevel.MEDIUM),
+            ([RiskLevel.LOW, RiskLevel.LOW], RiskLevel.LOW),
+        ],
+        ids=["critical", "high", "medium", "low"],
+    )
+    async def test_overall_risk_is_highest_level(
+        self,
+        mock_settings: SimpleNamespace,
+        mock_graph: SimpleNamespace,
+        levels: list[RiskLevel],
+        expected: RiskLevel,
     ) -> None:
-        """Test that overall risk is CRITICAL if any risk is critical."""
+        """Test that overall risk is the highest level among the assessed risks."""
         sample_risks = [
             RiskAssessment(
-                clause_id="c1",
-                risk_level=RiskLevel.LOW,
+                clause_id=f"c{i}",
+                risk_level=level,
                 confidence=0.9,
-                explanation="Low risk",
-            ),
-            RiskAssessment(
-                clause_id="c2",
-                risk_level=RiskLevel.CRITICAL,
-                confidence=0.95,
-                explanation="Critical risk",
-            ),
-        ]
-
-        mock_final_state = {
-            "status": "complete",
-            "clauses": [],
-            "risks": sample_risks,
-            "recommendations": [],
-            "error": None,
-        }
-
-        with patch("sae.agents.contract_review.contract_review_graph") as mock_graph:
-            mock_graph.ainvoke = AsyncMock(return_value=mock_final_state)
-
-            input_data = ContractInput(
-                task_id="test-004",
-                contract_text="Sample contract text",
+                explanation=f"{level.value.title()} risk",
             )
-            result = await run_contract_review(input_data)
-
-            assert result.analysis.overall_risk == RiskLevel.CRITICAL
-
-    async def test_overall_risk_high_if_any_high(
-        self, mock_settings: MagicMock
-    ) -> None:
-        """Test that overall risk is HIGH if any risk is high (no critical)."""
-        sample_risks = [
-            RiskAssessment(
-                clause_id="c1",
-                risk_level=RiskLevel.LOW,
-                confidence=0.9,
-                explanation="Low risk",
-            ),
-            RiskAssessment(
-                clause_id="c2",
-                risk_level=RiskLevel.HIGH,
-                confidence=0.85,
-                explanation="High risk",
-            ),
+            for i, level in enumerate(levels, start=1)
         ]
 
-        mock_final_state = {
+        mock_graph.ainvoke.result = {
             "status": "complete",
             "clauses": [],
             "risks": sample_risks,
@@ -245,114 +217,37 @@ class TestRunContractReview:
             "error": None,
         }
 
-        with patch("sae.agents.contract_review.contract_review_graph") as mock_graph:
-            mock_graph.ainvoke = AsyncMock(return_value=mock_final_state)
-
-            input_data = ContractInput(
-                task_id="test-005",
-                contract_text="Sample contract text",
-            )
-            result = await run_contract_review(input_data)
+        result = await run_contract_review(make_input("test-004"))
 
-            assert result.analysis.overall_risk == RiskLevel.HIGH
+        assert result.analysis.overall_risk == expected
 
-    async def test_overall_risk_medium_if_any_medium(
-        self, mock_settings: MagicMock
+    async def test_summary_includes_counts(
+        self, mock_settings: SimpleNamespace, mock_graph: SimpleNamespace
     ) -> None:
-        """Test that overall risk is MEDIUM if highest risk is medium."""
-        sample_risks = [
-            RiskAssessment(
-                clause_id="c1",
-                risk_level=RiskLevel.LOW,
-                confidence=0.9,
-                explanation="Low risk",
-            ),
-            RiskAssessment(
-                clause_id="c2",
-                risk_level=RiskLevel.MEDIUM,
-                confidence=0.8,
-                explanation="Medium risk",
-            ),
-        ]
-
-        mock_final_state = {
-            "status": "complete",
-            "clauses": [],
-            "risks": sample_risks,
-            "recommendations": [],
-            "error": None,
-        }
-
-        with patch("sae.agents.contract_review.contract_review_graph") as mock_graph:
-            mock_graph.ainvoke = AsyncMock(return_value=mock_final_state)
-
-            input_data = ContractInput(
-                task_id="test-006",
-                contract_text="Sample contract text",
-            )
-            result = await run_contract_review(input_data)
-
-            assert result.analysis.overall_risk == RiskLevel.MEDIUM
-
-    async def test_overall_risk_low_if_all_low(
-        self, mock_settings: MagicMock
-    ) -> None:
-        """Test that overall risk is LOW if all risks are low."""
-        sample_risks = [
-            RiskAssessment(
-                clause_id="c1",
-                risk_level=RiskLevel.LOW,
-                confidence=0.9,
-                explanation="Low risk",
-            ),
-            RiskAssessment(
-                clause_id="c2",
-                risk_level=RiskLevel.LOW,
-                confidence=0.88,
-                explanation="Also low risk",
-            ),
-        ]
-
-        mock_final_state = {
-            "status": "complete",
-            "clauses": [],
-            "risks": sample_risks,
-            "recommendations": [],
-            "error": None,
-        }
-
-        with patch("sae.agents.contract_review.contract_review_graph") as mock_graph:
-            mock_graph.ainvoke = AsyncMock(return_value=mock_final_state)
-
-            input_data = ContractInput(
-                task_id="test-007",
-                contract_text="Sample contract text",
-            )
-            result = await run_contract_review(input_data)
-
-            assert result.analysis.overall_risk == RiskLevel.LOW
-
-    async def test_summary_includes_counts(self, mock_settings: MagicMock) -> None:
         """Test that the summary includes clause, risk, and recommendation counts."""
-        sample_clauses = [
-            ExtractedClause(
-                id=f"c{i}",
-                type=ClauseType.OTHER,
-                title=f"Clause {i}",
-                text="Test",
-                location=f"Section {i}",
-            )
-            for i in range(5)
-        ]
-        sample_risks = [
-            RiskAssessment(
-                clause_id=f"c{i}",
-                risk_level=RiskLevel.MEDIUM,
-                confidence=0.8,
-                explanation="Test",
-            )
-            for i in range(3)
-        ]
+        sample_clauses = _CLAUSES_ADAPTER.validate_python(
+            [
+                {
+                    "id": f"c{i}",
+                    "type": ClauseType.OTHER,
+                    "title": f"Clause {i}",
+                    "text": "Test",
+                    "location": f"Section {i}",
+                }
+                for i in range(5)
+            ]
+        )
+        sample_risks = _RISKS_ADAPTER.validate_python(
+            [
+                {
+                    "clause_id": f"c{i}",
+                    "risk_level": RiskLevel.MEDIUM,
+                    "confidence": 0.8,
+                    "explanation": "Test",
+                }
+                for i in range(3)
+            ]
+        )
 
         mock_final_state = {
             "status": "complete",
@@ -362,20 +257,15 @@ class TestRunContractReview:
             "error": None,
         }
 
-        with patch("sae.agents.contract_review.contract_review_graph") as mock_graph:
-            mock_graph.ainvoke = AsyncMock(return_value=mock_final_state)
+        mock_graph.ainvoke.result = mock_final_state
 
-            input_data = ContractInput(
-                task_id="test-008",
-                contract_text="Sample contract text",
-            )
-            result = await run_contract_review(input_data)
+        result = await run_contract_review(make_input("test-008"))
 
-            assert "5 clauses" in result.analysis.summary
-            assert "3" in result.analysis.summary  # risk count
+        assert "5 clauses" in result.analysis.summary
+        assert "3" in result.analysis.summary  # risk count
 
     async def test_input_metadata_passed_to_output(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace, mock_graph: SimpleNamespace
     ) -> None:
         """Test that input metadata is passed to output analysis."""
         mock_final_state = {
@@ -386,18 +276,17 @@ class TestRunContractReview:
             "error": None,
         }
 
-        with patch("sae.agents.contract_review.contract_review_graph") as mock_graph:
-            mock_graph.ainvoke = AsyncMock(return_value=mock_final_state)
+        mock_graph.ainvoke.result = mock_final_state
 
-            input_data = ContractInput(
-                task_id="test-009",
-                contract_text="Sample contract text",
-                metadata={"source": "test", "version": 1},
-            )
-            result = await run_contract_review(input_data)
+        input_data = ContractInput(
+            task_id="test-009",
+            contract_text="Sample contract text",
+            metadata={"source": "test", "version": 1},
+        )
+        result = await run_contract_review(input_data)
 
-            assert result.analysis.metadata["source"] == "test"
-            assert result.analysis.metadata["version"] == 1
+        assert result.analysis.metadata["source"] == "test"
+        assert result.analysis.metadata["version"] == 1
 
 
 class TestContractInput:
@@ -1,9 +1,11 @@
 """Tests for the Agent Card endpoint."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
 
 from sae.api.agent_card import build_agent_card
 
@@ -11,21 +13,23 @@ from sae.api.agent_card import build_agent_card
 class TestBuildAgentCard:
     """Tests for build_agent_card function."""
 
-    def test_build_agent_card_uses_settings(self, mock_settings: MagicMock) -> None:
+    def test_build_agent_card_uses_settings(
+        self, monkeypatch: pytest.MonkeyPatch, mock_settings: SimpleNamespace
+    ) -> None:
         """Test that agent card uses settings values."""
-        with patch("sae.api.agent_card.get_settings", return_value=mock_settings):
-            card = build_agent_card("http://localhost:8000")
+        monkeypatch.setattr("sae.api.agent_card.get_settings", lambda: mock_settings)
+        card = build_agent_card("http://localhost:8000")
 
-            assert card.name == mock_settings.agent_name
-            assert card.description == mock_settings.agent_description
-            assert card.version == mock_settings.agent_version
+        assert card.name == mock_settings.agent_name
+        assert card.description == mock_settings.agent_description
+        assert card.version == mock_settings.agent_version
 
-    def test_build_agent_card_sets_url(self, mock_settings: MagicMock) -> None:
+    def test_build_agent_card_sets_url(self, mock_settings: SimpleNamespace) -> None:
         """Test that agent card sets the URL correctly."""
         card = build_agent_card("http://example.com")
         assert card.url == "http://example.com"
 
-    def test_build_agent_card_capabilities(self, mock_settings: MagicMock) -> None:
+    def test_build_agent_card_capabilities(self, mock_settings: SimpleNamespace) -> None:
         """Test agent card capabilities."""
         card = build_agent_card("http://localhost")
 
@@ -36,7 +40,7 @@ class TestBuildAgentCard:
         assert card.capabilities.state_transition_history is False
 
     def test_build_agent_card_has_contract_review_skill(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace
     ) -> None:
         """Test that agent card includes contract_review skill."""
         card = build_agent_card("http://localhost")
@@ -48,7 +52,7 @@ class TestBuildAgentCard:
         assert "legal" in card.skills[0].tags
 
     def test_build_agent_card_input_output_modes(
-        self, mock_settings: MagicMock
+        self, mock_settings: SimpleNamespace
     ) -> None:
         """Test agent card input/output modes."""
         card = build_agent_card("http://localhost")
@@ -56,7 +60,7 @@ class TestBuildAgentCard:
         assert card.default_input_modes == ["text", "file"]
         assert card.default_output_modes == ["text"]
 
-    def test_build_agent_card_has_provider(self, mock_settings: MagicMock) -> None:
+    def test_build_agent_card_has_provider(self, mock_settings: SimpleNamespace) -> None:
         """Test agent card provider info."""
         card = build_agent_card("http://localhost")
 
@@ -67,53 +71,48 @@ class TestBuildAgentCard:
 class TestAgentCardEndpoint:
     """Tests for /.well-known/agent.json endpoint."""
 
-    def test_get_agent_card_returns_200(self, client: TestClient) -> None:
+    @pytest.fixture(scope="class")
+    def card_response(self, client: TestClient) -> Response:
+        """Fetch the agent card once; the response is deterministic for the client."""
+        return client.get("/.well-known/agent.json")
+
+    @pytest.fixture(scope="class")
+    def card_json(self, card_response: Response) -> dict[str, Any]:
+        """Decode the agent card response body once for the class."""
+        return card_response.json()
+
+    def test_get_agent_card_returns_200(self, card_response: Response) -> None:
         """Test that agent card endpoint returns 200."""
-        response = client.get("/.well-known/agent.json")
-        assert response.status_code == 200
+        assert card_response.status_code == 200
 
-    def test_get_agent_card_returns_json(self, client: TestClient) -> None:
+    def test_get_agent_card_returns_json(self, card_json: dict[str, Any]) -> None:
         """Test that agent card endpoint returns JSON."""
-        response = client.get("/.well-known/agent.json")
-        data = response.json()
-        assert isinstance(data, dict)
+        assert isinstance(card_json, dict)
 
     def test_get_agent_card_contains_required_fields(
-        self, client: TestClient
+        self, card_json: dict[str, Any]
     ) -> None:
         """Test that agent card contains required fields."""
-        response = client.get("/.well-known/agent.json")
-        data = response.json()
-
-        assert "name" in data
-        assert "description" in data
-        assert "url" in data
-        assert "version" in data
-        assert "capabilities" in data
-        assert "skills" in data
-
-    def test_get_agent_card_uses_camel_case(self, client: TestClient) -> None:
+        assert "name" in card_json
+        assert "description" in card_json
+        assert "url" in card_json
+        assert "version" in card_json
+        assert "capabilities" in card_json
+        assert "skills" in card_json
+
+    def test_get_agent_card_uses_camel_case(self, card_json: dict[str, Any]) -> None:
         """Test that agent card uses camelCase for aliases."""
-        response = client.get("/.well-known/agent.json")
-        data = response.json()
-
         # Check capabilities uses camelCase
-        caps = data["capabilities"]
+        caps = card_json["capabilities"]
         assert "pushNotifications" in caps
         assert "stateTransitionHistory" in caps
 
-    def test_get_agent_card_excludes_none_values(self, client: TestClient) -> None:
+    def test_get_agent_card_excludes_none_values(self, card_json: dict[str, Any]) -> None:
         """Test that null values are excluded from response."""
-        response = client.get("/.well-known/agent.json")
-        data = response.json()
-
         # documentationUrl should not be present (it's None by default)
-        assert "documentationUrl" not in data
+        assert "documentationUrl" not in card_json
 
-    def test_get_agent_card_url_matches_request(self, client: TestClient) -> None:
+    def test_get_agent_card_url_matches_request(self, card_json: dict[str, Any]) -> None:
         """Test that URL in agent card matches request base URL."""
-        response = client.get("/.well-known/agent.json")
-        data = response.json()
-
         # TestClient uses http://testserver
-        assert "testserver" in data["url"]
+        assert "testserver" in card_json["url"]
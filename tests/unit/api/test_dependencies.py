@@ -1,173 +1,127 @@
 """Tests for API dependencies (authentication)."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import secrets
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi import HTTPException
 
 from sae.api.dependencies import verify_api_key
+from sae.config import Settings
 
 
-class TestVerifyApiKey:
-    """Tests for verify_api_key dependency."""
-
-    @pytest.mark.asyncio
-    async def test_auth_disabled_when_no_api_key_configured(self) -> None:
-        """Test that auth passes when no API_KEY is configured."""
-        mock_settings = MagicMock()
-        mock_settings.api_key = None  # Auth disabled
+@pytest.fixture
+def auth_settings() -> MagicMock:
+    """Create settings to pass straight to verify_api_key; each test sets api_key itself."""
+    return MagicMock(spec=Settings)
 
-        mock_request = MagicMock()
-        mock_request.url.path = "/a2a"
-        mock_request.method = "POST"
-        mock_request.client.host = "127.0.0.1"
-
-        with patch("sae.api.dependencies.get_settings", return_value=mock_settings):
-            result = await verify_api_key(
-                request=mock_request,
-                settings=mock_settings,
-                x_api_key=None,
-            )
 
-        assert result is None
+@pytest.fixture
+def mock_request() -> MagicMock:
+    """Create a mock request with path, method and client info."""
+    request = MagicMock()
+    request.url.path = "/a2a"
+    request.method = "POST"
+    request.client.host = "127.0.0.1"
+    return request
 
-    @pytest.mark.asyncio
-    async def test_auth_passes_with_valid_key(self) -> None:
-        """Test that auth passes with valid API key."""
-        mock_settings = MagicMock()
-        mock_settings.api_key = "valid-secret-key"
 
-        mock_request = MagicMock()
-        mock_request.url.path = "/a2a"
-        mock_request.method = "POST"
-        mock_request.client.host = "127.0.0.1"
+class TestVerifyApiKey:
+    """Tests for verify_api_key dependency."""
 
-        with patch("sae.api.dependencies.get_settings", return_value=mock_settings):
-            result = await verify_api_key(
+    @pytest.mark.parametrize(
+        ("configured_key", "provided_key", "has_client", "expected"),
+        [
+            pytest.param(None, None, True, None, id="auth-disabled"),
+            pytest.param(
+                "valid-secret-key", "valid-secret-key", True, "valid-secret-key", id="valid-key"
+            ),
+            pytest.param(
+                "valid-secret-key", "valid-secret-key", False, "valid-secret-key", id="no-client"
+            ),
+        ],
+    )
+    async def test_auth_passes(
+        self,
+        auth_settings: MagicMock,
+        mock_request: MagicMock,
+        configured_key: str | None,
+        provided_key: str | None,
+        has_client: bool,
+        expected: str | None,
+    ) -> None:
+        """Test that auth passes when disabled or given the configured key."""
+        auth_settings.api_key = configured_key
+        if not has_client:
+            mock_request.client = None  # No client info
+
+        result = await verify_api_key(
+            request=mock_request,
+            settings=auth_settings,
+            x_api_key=provided_key,
+        )
+
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        ("provided_key", "detail"),
+        [
+            pytest.param("wrong-key", "Invalid API key", id="invalid-key"),
+            pytest.param(None, "Missing API key", id="missing-key"),
+            pytest.param("", "Invalid API key", id="empty-key"),
+        ],
+    )
+    async def test_auth_fails(
+        self,
+        auth_settings: MagicMock,
+        mock_request: MagicMock,
+        provided_key: str | None,
+        detail: str,
+    ) -> None:
+        """Test that auth fails with 401 when the key is wrong, missing or empty."""
+        auth_settings.api_key = "valid-secret-key"
+
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_api_key(
                 request=mock_request,
-                settings=mock_settings,
-                x_api_key="valid-secret-key",
+                settings=auth_settings,
+                x_api_key=provided_key,
             )
 
-        assert result == "valid-secret-key"
-
-    @pytest.mark.asyncio
-    async def test_auth_fails_with_invalid_key(self) -> None:
-        """Test that auth fails with invalid API key."""
-        mock_settings = MagicMock()
-        mock_settings.api_key = "valid-secret-key"
-
-        mock_request = MagicMock()
-        mock_request.url.path = "/a2a"
-        mock_request.method = "POST"
-        mock_request.client.host = "127.0.0.1"
-
-        with patch("sae.api.dependencies.get_settings", return_value=mock_settings):
-            with pytest.raises(HTTPException) as exc_info:
-                await verify_api_key(
-                    request=mock_request,
-                    settings=mock_settings,
-                    x_api_key="wrong-key",
-                )
-
         assert exc_info.value.status_code == 401
-        assert "Invalid API key" in exc_info.value.detail
-
-    @pytest.mark.asyncio
-    async def test_auth_fails_with_missing_key(self) -> None:
-        """Test that auth fails when API key is required but not provided."""
-        mock_settings = MagicMock()
-        mock_settings.api_key = "valid-secret-key"
-
-        mock_request = MagicMock()
-        mock_request.url.path = "/a2a"
-        mock_request.method = "POST"
-        mock_request.client.host = "127.0.0.1"
-
-        with patch("sae.api.dependencies.get_settings", return_value=mock_settings):
-            with pytest.raises(HTTPException) as exc_info:
-                await verify_api_key(
-                    request=mock_request,
-                    settings=mock_settings,
-                    x_api_key=None,
-                )
+        assert detail in exc_info.value.detail
+
+    async def test_constant_time_comparison(
+        self,
+        auth_settings: MagicMock,
+        mock_request: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that key comparison uses constant-time algorithm.
 
-        assert exc_info.value.status_code == 401
-        assert "Missing API key" in exc_info.value.detail
+        This test verifies the security property that timing attacks
+        are mitigated by using secrets.compare_digest.
+        """
+        auth_settings.api_key = "a" * 100  # Long key
+        calls: list[tuple[str, str]] = []
 
-    @pytest.mark.asyncio
-    async def test_auth_with_no_client_info(self) -> None:
-        """Test that auth works when client info is not available."""
-        mock_settings = MagicMock()
-        mock_settings.api_key = "valid-secret-key"
+        def spy_compare_digest(a: str, b: str) -> bool:
+            calls.append((a, b))
+            return secrets.compare_digest(a, b)
 
-        mock_request = MagicMock()
-        mock_request.url.path = "/a2a"
-        mock_request.method = "POST"
-        mock_request.client = None  # No client info
+        monkeypatch.setattr(
+            "sae.api.dependencies.secrets", SimpleNamespace(compare_digest=spy_compare_digest)
+        )
 
-        with patch("sae.api.dependencies.get_settings", return_value=mock_settings):
-            result = await verify_api_key(
+        # Only last char different: must still go through compare_digest
+        with pytest.raises(HTTPException) as exc_info:
+            await verify_api_key(
                 request=mock_request,
-                settings=mock_settings,
-                x_api_key="valid-secret-key",
+                settings=auth_settings,
+                x_api_key="a" * 99 + "b",
             )
 
-        assert result == "valid-secret-key"
-
-    @pytest.mark.asyncio
-    async def test_constant_time_comparison(self) -> None:
-        """Test that key comparison uses constant-time algorithm.
-
-        This test verifies the security property that timing attacks
-        are mitigated by using secrets.compare_digest.
-        """
-        mock_settings = MagicMock()
-        mock_settings.api_key = "a" * 100  # Long key
-
-        mock_request = MagicMock()
-        mock_request.url.path = "/a2a"
-        mock_request.method = "POST"
-        mock_request.client.host = "127.0.0.1"
-
-        # Test that both completely wrong and partially correct keys
-        # result in the same error (timing should be similar)
-        with patch("sae.api.dependencies.get_settings", return_value=mock_settings):
-            with pytest.raises(HTTPException) as exc1:
-                await verify_api_key(
-                    request=mock_request,
-                    settings=mock_settings,
-                    x_api_key="b" * 100,  # Completely different
-                )
-
-            with pytest.raises(HTTPException) as exc2:
-                await verify_api_key(
-                    request=mock_request,
-                    settings=mock_settings,
-                    x_api_key="a" * 99 + "b",  # Only last char different
-                )
-
-        # Both should result in same error
-        assert exc1.value.status_code == exc2.value.status_code
-        assert exc1.value.detail == exc2.value.detail
-
-    @pytest.mark.asyncio
-    async def test_empty_api_key_fails(self) -> None:
-        """Test that empty API key fails when auth is enabled."""
-        mock_settings = MagicMock()
-        mock_settings.api_key = "valid-secret-key"
-
-        mock_request = MagicMock()
-        mock_request.url.path = "/a2a"
-        mock_request.method = "POST"
-        mock_request.client.host = "127.0.0.1"
-
-        with patch("sae.api.dependencies.get_settings", return_value=mock_settings):
-            with pytest.raises(HTTPException) as exc_info:
-                await verify_api_key(
-                    request=mock_request,
-                    settings=mock_settings,
-                    x_api_key="",  # Empty key
-                )
-
+        assert calls == [("a" * 99 + "b", "a" * 100)]
         assert exc_info.value.status_code == 401
+        assert exc_info.value.detail == "Invalid API key."
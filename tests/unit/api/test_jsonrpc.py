@@ -1,9 +1,14 @@
 """Tests for the JSON-RPC handler."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
+from httpx import Response
 
 from sae.api.jsonrpc import (
     INTERNAL_ERROR,
@@ -17,38 +22,115 @@ from sae.api.jsonrpc import (
     make_success_response,
 )
 from sae.models.a2a import TaskState
+from sae.services.task_manager import InvalidStateTransitionError, TaskNotFoundError
+
+
+def make_task(
+    task_id: str = "task-123",
+    state: TaskState = TaskState.SUBMITTED,
+    timestamp: str = "2024-01-01T12:00:00",
+) -> SimpleNamespace:
+    """Create a task stub with the fields the JSON-RPC handlers serialize."""
+    return SimpleNamespace(
+        id=task_id,
+        status=SimpleNamespace(
+            state=state,
+            timestamp=SimpleNamespace(isoformat=lambda: timestamp),
+        ),
+        artifacts=[],
+        history=[],
+        metadata={},
+    )
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def encode_rpc(method: str, params: dict[str, Any] | None = None, rpc_id: str = "req") -> bytes:
+    """Serialize a JSON-RPC 2.0 request envelope to bytes."""
+    payload: dict[str, Any] = {"jsonrpc": "2.0", "method": method, "id": rpc_id}
+    if params is not None:
+        payload["params"] = params
+    return json.dumps(payload).encode()
+
+
+# Success-path request bodies, encoded once at import
+TASKS_SEND_BODY = encode_rpc(
+    "tasks/send",
+    {
+        "id": "task-123",
+        "message": {
+            "role": "user",
+            "parts": [{"type": "text", "text": "Test contract"}],
+        },
+    },
+    rpc_id="req-1",
+)
+TASKS_GET_BODY = encode_rpc("tasks/get", {"id": "task-123"}, rpc_id="req-2")
+TASKS_CANCEL_BODY = encode_rpc("tasks/cancel", {"id": "task-123"}, rpc_id="req-4")
 
+PostBody = Callable[[bytes], Response]
+RpcCall = Callable[..., Response]
 
-class TestErrorCodes:
-    """Tests for JSON-RPC error codes."""
 
-    def test_parse_error_code(self) -> None:
-        """Test PARSE_ERROR code value."""
-        assert PARSE_ERROR == -32700
+@pytest.fixture
+def post_body(client: TestClient) -> PostBody:
+    """Return a helper that posts a pre-encoded JSON-RPC body to /a2a."""
+
+    def _post(body: bytes) -> Response:
+        return client.post("/a2a", content=body, headers=JSON_HEADERS)
+
+    return _post
 
-    def test_invalid_request_code(self) -> None:
-        """Test INVALID_REQUEST code value."""
-        assert INVALID_REQUEST == -32600
 
-    def test_method_not_found_code(self) -> None:
-        """Test METHOD_NOT_FOUND code value."""
-        assert METHOD_NOT_FOUND == -32601
+@pytest.fixture
+def rpc(post_body: PostBody) -> RpcCall:
+    """Return a helper that encodes and posts a JSON-RPC 2.0 request to /a2a."""
 
-    def test_invalid_params_code(self) -> None:
-        """Test INVALID_PARAMS code value."""
-        assert INVALID_PARAMS == -32602
+    def _call(
+        method: str, params: dict[str, Any] | None = None, rpc_id: str = "req"
+    ) -> Response:
+        return post_body(encode_rpc(method, params, rpc_id))
 
-    def test_internal_error_code(self) -> None:
-        """Test INTERNAL_ERROR code value."""
-        assert INTERNAL_ERROR == -32603
+    return _call
 
-    def test_task_not_found_code(self) -> None:
-        """Test TASK_NOT_FOUND code value."""
-        assert TASK_NOT_FOUND == -32001
 
-    def test_invalid_state_code(self) -> None:
-        """Test INVALID_STATE code value."""
-        assert INVALID_STATE == -32002
+@pytest.fixture
+def mock_tm(
+    mock_task_manager: MagicMock, override_task_manager: Callable[[Any], None]
+) -> MagicMock:
+    """Inject the stubbed task manager into the JSON-RPC endpoint."""
+    override_task_manager(mock_task_manager)
+    return mock_task_manager
+
+
+class TestErrorCodes:
+    """Tests for JSON-RPC error codes."""
+
+    @pytest.mark.parametrize(
+        ("constant", "expected"),
+        [
+            (PARSE_ERROR, -32700),
+            (INVALID_REQUEST, -32600),
+            (METHOD_NOT_FOUND, -32601),
+            (INVALID_PARAMS, -32602),
+            (INTERNAL_ERROR, -32603),
+            (TASK_NOT_FOUND, -32001),
+            (INVALID_STATE, -32002),
+        ],
+        ids=[
+            "parse",
+            "invalid_request",
+            "method_not_found",
+            "invalid_params",
+            "internal",
+            "task_not_found",
+            "invalid_state",
+        ],
+    )
+    def test_error_code(self, constant: int, expected: int) -> None:
+        """Test that each JSON-RPC error code constant has its spec value."""
+        assert constant == expected
 
 
 class TestMakeErrorResponse:
@@ -126,213 +208,91 @@ class TestHandleJsonrpcEndpoint:
 
         assert data["error"]["code"] == INVALID_REQUEST
 
-    def test_unknown_method_returns_method_not_found(
-        self, client: TestClient
-    ) -> None:
+    def test_unknown_method_returns_method_not_found(self, rpc: RpcCall) -> None:
         """Test that unknown method returns METHOD_NOT_FOUND."""
-        response = client.post(
-            "/a2a",
-            json={
-                "jsonrpc": "2.0",
-                "method": "unknown/method",
-                "id": "1",
-            },
-        )
+        response = rpc("unknown/method", rpc_id="1")
         data = response.json()
 
         assert data["error"]["code"] == METHOD_NOT_FOUND
 
     def test_tasks_send_creates_task(
-        self, client: TestClient, mock_settings: MagicMock
+        self, post_body: PostBody, mock_settings: SimpleNamespace, mock_tm: MagicMock
     ) -> None:
         """Test that tasks/send creates a new task."""
-        # Mock the task manager with all async methods
-        with patch("sae.api.jsonrpc.get_task_manager") as mock_get_tm:
-            mock_task = MagicMock()
-            mock_task.id = "new-task-123"
-            mock_task.status.state = TaskState.SUBMITTED
-            mock_task.status.timestamp.isoformat.return_value = "2024-01-01T12:00:00"
-            mock_task.history = []
-            mock_task.metadata = {}
-
-            mock_tm = MagicMock()
-            mock_tm.create_task = AsyncMock(return_value=mock_task)
-            mock_tm.get_task = AsyncMock(return_value=mock_task)
-            mock_tm.update_status = AsyncMock()
-            mock_tm.fail_task = AsyncMock()
-            mock_tm.complete_task = AsyncMock()
-            mock_tm.add_artifact = AsyncMock()
-            mock_get_tm.return_value = mock_tm
-
-            response = client.post(
-                "/a2a",
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "tasks/send",
-                    "id": "req-1",
-                    "params": {
-                        "id": "task-123",
-                        "message": {
-                            "role": "user",
-                            "parts": [{"type": "text", "text": "Test contract"}],
-                        },
-                    },
-                },
-            )
-
-            assert response.status_code == 200
-            data = response.json()
-            assert "result" in data
-            assert data["result"]["id"] == "new-task-123"
-
-    def test_tasks_send_invalid_params_returns_error(
-        self, client: TestClient
-    ) -> None:
+        mock_task = make_task("new-task-123")
+        mock_tm.create_task.return_value = mock_task
+        mock_tm.get_task.return_value = mock_task
+
+        response = post_body(TASKS_SEND_BODY)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert "result" in data
+        assert data["result"]["id"] == "new-task-123"
+
+    def test_tasks_send_invalid_params_returns_error(self, rpc: RpcCall) -> None:
         """Test that tasks/send with invalid params returns error."""
-        response = client.post(
-            "/a2a",
-            json={
-                "jsonrpc": "2.0",
-                "method": "tasks/send",
-                "id": "req-1",
-                "params": {
-                    # Missing required fields
-                },
-            },
-        )
+        response = rpc("tasks/send", {}, rpc_id="req-1")  # Missing required fields
         data = response.json()
 
         assert data["error"]["code"] == INVALID_PARAMS
 
     def test_tasks_get_returns_task(
-        self, client: TestClient, mock_settings: MagicMock
+        self, post_body: PostBody, mock_settings: SimpleNamespace, mock_tm: MagicMock
     ) -> None:
         """Test that tasks/get returns task status."""
-        with patch("sae.api.jsonrpc.get_task_manager") as mock_get_tm:
-            mock_task = MagicMock()
-            mock_task.id = "task-123"
-            mock_task.status.state = TaskState.WORKING
-            mock_task.status.timestamp.isoformat.return_value = "2024-01-01T12:00:00"
-            mock_task.artifacts = []
-            mock_task.history = []
-
-            mock_tm = MagicMock()
-            mock_tm.get_task = AsyncMock(return_value=mock_task)
-            mock_get_tm.return_value = mock_tm
-
-            response = client.post(
-                "/a2a",
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "tasks/get",
-                    "id": "req-2",
-                    "params": {"id": "task-123"},
-                },
-            )
-
-            data = response.json()
-            assert "result" in data
-            assert data["result"]["id"] == "task-123"
-            assert data["result"]["status"]["state"] == "working"
+        mock_tm.get_task.return_value = make_task(state=TaskState.WORKING)
+
+        response = post_body(TASKS_GET_BODY)
+
+        data = response.json()
+        assert "result" in data
+        assert data["result"]["id"] == "task-123"
+        assert data["result"]["status"]["state"] == "working"
 
     def test_tasks_get_not_found(
-        self, client: TestClient, mock_settings: MagicMock
+        self, rpc: RpcCall, mock_settings: SimpleNamespace, mock_tm: MagicMock
     ) -> None:
         """Test that tasks/get returns TASK_NOT_FOUND for missing task."""
-        from sae.services.task_manager import TaskNotFoundError
-
-        with patch("sae.api.jsonrpc.get_task_manager") as mock_get_tm:
-            mock_tm = MagicMock()
-            mock_tm.get_task = AsyncMock(
-                side_effect=TaskNotFoundError("Task not found")
-            )
-            mock_get_tm.return_value = mock_tm
-
-            response = client.post(
-                "/a2a",
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "tasks/get",
-                    "id": "req-3",
-                    "params": {"id": "nonexistent"},
-                },
-            )
-
-            data = response.json()
-            assert data["error"]["code"] == TASK_NOT_FOUND
+        mock_tm.get_task.side_effect = TaskNotFoundError("Task not found")
+
+        response = rpc("tasks/get", {"id": "nonexistent"}, rpc_id="req-3")
+
+        data = response.json()
+        assert data["error"]["code"] == TASK_NOT_FOUND
 
     def test_tasks_cancel_success(
-        self, client: TestClient, mock_settings: MagicMock
+        self, post_body: PostBody, mock_settings: SimpleNamespace, mock_tm: MagicMock
     ) -> None:
         """Test that tasks/cancel cancels a task."""
-        with patch("sae.api.jsonrpc.get_task_manager") as mock_get_tm:
-            mock_task = MagicMock()
-            mock_task.id = "task-123"
-            mock_task.status.state = TaskState.CANCELED
-            mock_task.status.timestamp.isoformat.return_value = "2024-01-01T12:05:00"
-
-            mock_tm = MagicMock()
-            mock_tm.cancel_task = AsyncMock(return_value=mock_task)
-            mock_get_tm.return_value = mock_tm
-
-            response = client.post(
-                "/a2a",
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "tasks/cancel",
-                    "id": "req-4",
-                    "params": {"id": "task-123"},
-                },
-            )
-
-            data = response.json()
-            assert "result" in data
-            assert data["result"]["status"]["state"] == "canceled"
+        mock_tm.cancel_task.return_value = make_task(
+            state=TaskState.CANCELED, timestamp="2024-01-01T12:05:00"
+        )
+
+        response = post_body(TASKS_CANCEL_BODY)
+
+        data = response.json()
+        assert "result" in data
+        assert data["result"]["status"]["state"] == "canceled"
 
     def test_tasks_cancel_invalid_state(
-        self, client: TestClient, mock_settings: MagicMock
+        self, rpc: RpcCall, mock_settings: SimpleNamespace, mock_tm: MagicMock
     ) -> None:
         """Test that canceling completed task returns INVALID_STATE."""
-        from sae.services.task_manager import InvalidStateTransitionError
-
-        with patch("sae.api.jsonrpc.get_task_manager") as mock_get_tm:
-            mock_tm = MagicMock()
-            mock_tm.cancel_task = AsyncMock(
-                side_effect=InvalidStateTransitionError("Cannot cancel")
-            )
-            mock_get_tm.return_value = mock_tm
-
-            response = client.post(
-                "/a2a",
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "tasks/cancel",
-                    "id": "req-5",
-                    "params": {"id": "completed-task"},
-                },
-            )
-
-            data = response.json()
-            assert data["error"]["code"] == INVALID_STATE
+        mock_tm.cancel_task.side_effect = InvalidStateTransitionError("Cannot cancel")
+
+        response = rpc("tasks/cancel", {"id": "completed-task"}, rpc_id="req-5")
+
+        data = response.json()
+        assert data["error"]["code"] == INVALID_STATE
 
     def test_internal_error_handling(
-        self, client: TestClient, mock_settings: MagicMock
+        self, rpc: RpcCall, mock_settings: SimpleNamespace, mock_tm: MagicMock
     ) -> None:
         """Test that unexpected errors return INTERNAL_ERROR."""
-        with patch("sae.api.jsonrpc.get_task_manager") as mock_get_tm:
-            mock_tm = MagicMock()
-            mock_tm.get_task = AsyncMock(side_effect=RuntimeError("Unexpected"))
-            mock_get_tm.return_value = mock_tm
-
-            response = client.post(
-                "/a2a",
-                json={
-                    "jsonrpc": "2.0",
-                    "method": "tasks/get",
-                    "id": "req-6",
-                    "params": {"id": "task-123"},
-                },
-            )
-
-            data = response.json()
-            assert data["error"]["code"] == INTERNAL_ERROR
+        mock_tm.get_task.side_effect = RuntimeError("Unexpected")
+
+        response = rpc("tasks/get", {"id": "task-123"}, rpc_id="req-6")
+
+        data = response.json()
+        assert data["error"]["code"] == INTERNAL_ERROR
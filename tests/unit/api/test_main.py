@@ -1,35 +1,36 @@
 """Tests for the main FastAPI application."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from httpx import Response
+
+from sae.main import create_app
 
 
 class TestCreateApp:
     """Tests for create_app function."""
 
-    def test_create_app_returns_fastapi_instance(self, mock_settings: MagicMock) -> None:
-        """Test that create_app returns a FastAPI instance."""
-        from sae.main import create_app
+    @pytest.fixture(scope="class")
+    def fresh_app(self, mock_settings: SimpleNamespace) -> FastAPI:
+        """Build one app for the class; these tests only inspect static attributes."""
+        return create_app()
 
-        app = create_app()
-        assert isinstance(app, FastAPI)
+    def test_create_app_returns_fastapi_instance(self, fresh_app: FastAPI) -> None:
+        """Test that create_app returns a FastAPI instance."""
+        assert isinstance(fresh_app, FastAPI)
 
-    def test_create_app_has_title(self, mock_settings: MagicMock) -> None:
+    def test_create_app_has_title(self, fresh_app: FastAPI) -> None:
         """Test that app has correct title."""
-        from sae.main import create_app
+        assert fresh_app.title == "Sae Legal Agent"
 
-        app = create_app()
-        assert app.title == "Sae Legal Agent"
-
-    def test_create_app_includes_routers(self, mock_settings: MagicMock) -> None:
+    def test_create_app_includes_routers(self, fresh_app: FastAPI) -> None:
         """Test that all routers are included."""
-        from sae.main import create_app
-
-        app = create_app()
-        routes = [route.path for route in app.routes]
+        routes = [route.path for route in fresh_app.routes]
 
         # Check for key endpoints
         assert "/.well-known/agent.json" in routes
@@ -40,56 +41,59 @@ class TestCreateApp:
 class TestHealthEndpoint:
     """Tests for the /health endpoint."""
 
-    def test_health_returns_200(self, client: TestClient) -> None:
+    @pytest.fixture(scope="class")
+    def health_response(self, client: TestClient) -> Response:
+        """Fetch the health check once for the class."""
+        return client.get("/health")
+
+    @pytest.fixture(scope="class")
+    def health_json(self, health_response: Response) -> dict[str, Any]:
+        """Decode the health check body once for the class."""
+        return health_response.json()
+
+    def test_health_returns_200(self, health_response: Response) -> None:
         """Test that health endpoint returns 200."""
-        response = client.get("/health")
-        assert response.status_code == 200
+        assert health_response.status_code == 200
 
-    def test_health_returns_healthy_status(self, client: TestClient) -> None:
+    def test_health_returns_healthy_status(self, health_json: dict[str, Any]) -> None:
         """Test that health endpoint returns healthy status."""
-        response = client.get("/health")
-        data = response.json()
-        assert data["status"] == "healthy"
+        assert health_json["status"] == "healthy"
 
-    def test_health_returns_version(self, client: TestClient) -> None:
+    def test_health_returns_version(self, health_json: dict[str, Any]) -> None:
         """Test that health endpoint returns version."""
-        response = client.get("/health")
-        data = response.json()
-        assert "version" in data
+        assert "version" in health_json
 
     def test_health_returns_agent_name(
-        self, client: TestClient, mock_settings: MagicMock
+        self, health_json: dict[str, Any], mock_settings: SimpleNamespace
     ) -> None:
         """Test that health endpoint returns agent name."""
-        response = client.get("/health")
-        data = response.json()
-        assert data["agent"] == mock_settings.agent_name
+        assert health_json["agent"] == mock_settings.agent_name
 
 
 class TestDocsEndpoint:
     """Tests for documentation endpoints."""
 
-    def test_docs_available_in_development(self, mock_settings: MagicMock) -> None:
+    def test_docs_available_in_development(
+        self, monkeypatch: pytest.MonkeyPatch, mutable_settings: SimpleNamespace
+    ) -> None:
         """Test that /docs is available in development."""
-        mock_settings.is_production = False
-
-        from sae.main import create_app
+        mutable_settings.is_production = False
+        monkeypatch.setattr("sae.main.get_settings", lambda: mutable_settings)
 
         app = create_app()
         assert app.docs_url == "/docs"
         assert app.redoc_url == "/redoc"
 
     def test_docs_disabled_in_production(
-        self, mock_production_settings: MagicMock
+        self, monkeypatch: pytest.MonkeyPatch, mock_production_settings: MagicMock
     ) -> None:
         """Test that /docs is disabled in production."""
         # Need to patch where get_settings is used in main.py
-        with patch("sae.main.get_settings", return_value=mock_production_settings):
-            from sae.main import create_app
+        monkeypatch.setattr("sae.main.get_settings", lambda: mock_production_settings)
 
-            app = create_app()
-            assert app.docs_url is None
-            assert app.redoc_url is None
+        app = create_app()
+        assert app.docs_url is None
+        assert app.redoc_url is None
 
 
 class TestCORS:
@@ -0,0 +1,102 @@
+"""Shared fixtures for the model tests.
+
+These are session-scoped, read-only model instances: tests only read them or
+pass them into the model under test, so one instance per xdist worker is enough.
+Each one is passed through freeze() so a test that assigns to a field fails
+instead of leaking state into later tests.
+"""
+
+import pytest
+
+from sae.models.a2a import (
+    AgentCard,
+    Artifact,
+    JsonRpcError,
+    Message,
+    TaskStatus,
+    TextPart,
+)
+from sae.models.clauses import RiskAssessment, RiskLevel
+
+from tests.fixtures.models import (
+    COMPLETED_STATUS,
+    REPORT_CONTENT,
+    SUBMITTED_STATUS,
+    build_message,
+    build_text_part,
+    freeze,
+)
+
+
+@pytest.fixture(scope="session")
+def hello_text_part() -> TextPart:
+    """Create a text part reused across the session."""
+    return freeze(TextPart(text="Hello"))
+
+
+@pytest.fixture(scope="session")
+def user_msg(hello_text_part: TextPart) -> Message:
+    """Create a user message reused across the session."""
+    return freeze(Message(role="user", parts=[hello_text_part]))
+
+
+@pytest.fixture(scope="session")
+def agent_msg() -> Message:
+    """Create an agent message reused across the session."""
+    return freeze(build_message(role="agent", parts=[build_text_part("Working on it...")]))
+
+
+@pytest.fixture(scope="session")
+def submitted_status() -> TaskStatus:
+    """Create a submitted status reused across the session."""
+    return SUBMITTED_STATUS
+
+
+@pytest.fixture(scope="session")
+def completed_status() -> TaskStatus:
+    """Create a completed status reused across the session."""
+    return COMPLETED_STATUS
+
+
+@pytest.fixture(scope="session")
+def default_card() -> AgentCard:
+    """Create an AgentCard with only the required fields set."""
+    return freeze(
+        AgentCard(
+            name="Test",
+            description="Test",
+            url="http://test",
+            version="0.1.0",
+        )
+    )
+
+
+@pytest.fixture(scope="session")
+def report_artifact() -> Artifact:
+    """Create a report artifact reused across the session."""
+    return freeze(Artifact(name="report", parts=[REPORT_CONTENT]))
+
+
+@pytest.fixture(scope="session")
+def invalid_request_error() -> JsonRpcError:
+    """Create a JSON-RPC Invalid Request error reused across the session."""
+    return freeze(JsonRpcError(code=-32600, message="Invalid Request"))
+
+
+@pytest.fixture(scope="session")
+def parse_error() -> JsonRpcError:
+    """Create a JSON-RPC Parse error reused across the session."""
+    return freeze(JsonRpcError(code=-32700, message="Parse error"))
+
+
+@pytest.fixture(scope="session")
+def default_risk() -> RiskAssessment:
+    """Create a RiskAssessment with only the required fields set."""
+    return freeze(
+        RiskAssessment(
+            clause_id="test",
+            risk_level=RiskLevel.LOW,
+            confidence=0.5,
+            explanation="Test",
+        )
+    )
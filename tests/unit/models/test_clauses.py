@@ -1,7 +1,7 @@
 """Tests for clause analysis models."""
 
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from sae.models.clauses import (
     ClauseType,
@@ -12,13 +12,26 @@ from sae.models.clauses import (
     RiskLevel,
 )
 
+ALL_CLAUSE_TYPES = tuple(ClauseType)
+ALL_RISK_LEVELS = tuple(RiskLevel)
+
+_RISK_ADAPTER = TypeAdapter(RiskAssessment)
+_REC_ADAPTER = TypeAdapter(Recommendation)
+
+
+def first_error_field(exc: ValidationError) -> str | int:
+    """Return the field named by the first error, skipping URL and context formatting."""
+    errors = exc.errors(include_url=False, include_context=False)
+    assert errors
+    return errors[0]["loc"][-1]
+
 
 class TestClauseType:
     """Tests for ClauseType enum."""
 
     def test_clause_type_has_16_values(self) -> None:
         """Test that ClauseType has exactly 16 values."""
-        assert len(ClauseType) == 16
+        assert len(ALL_CLAUSE_TYPES) == 16
 
     def test_clause_type_values(self) -> None:
         """Test specific ClauseType values."""
@@ -41,8 +54,7 @@ class TestClauseType:
 
     def test_clause_type_is_string_enum(self) -> None:
         """Test that ClauseType values are strings."""
-        for clause_type in ClauseType:
-            assert isinstance(clause_type.value, str)
+        assert all(isinstance(clause_type.value, str) for clause_type in ALL_CLAUSE_TYPES)
 
 
 class TestRiskLevel:
@@ -50,7 +62,7 @@ class TestRiskLevel:
 
     def test_risk_level_has_4_values(self) -> None:
         """Test that RiskLevel has exactly 4 values."""
-        assert len(RiskLevel) == 4
+        assert len(ALL_RISK_LEVELS) == 4
 
     def test_risk_level_values(self) -> None:
         """Test RiskLevel values."""
@@ -107,17 +119,19 @@ class TestExtractedClause:
                 # Missing: title, text, location
             )  # type: ignore
 
-    def test_extracted_clause_all_clause_types(self) -> None:
+    @pytest.mark.parametrize(
+        "clause_type", ALL_CLAUSE_TYPES, ids=[c.value for c in ALL_CLAUSE_TYPES]
+    )
+    def test_extracted_clause_all_clause_types(self, clause_type: ClauseType) -> None:
         """Test that all ClauseType values can be used."""
-        for clause_type in ClauseType:
-            clause = ExtractedClause(
-                id=f"test-{clause_type.value}",
-                type=clause_type,
-                title="Test",
-                text="Test text",
-                location="Section 1",
-            )
-            assert clause.type == clause_type
+        clause = ExtractedClause(
+            id=f"test-{clause_type.value}",
+            type=clause_type,
+            title="Test",
+            text="Test text",
+            location="Section 1",
+        )
+        assert clause.type == clause_type
 
 
 class TestRiskAssessment:
@@ -148,7 +162,7 @@ class TestRiskAssessment:
                 confidence=-0.1,
                 explanation="Test",
             )
-        assert "confidence" in str(exc_info.value)
+        assert first_error_field(exc_info.value) == "confidence"
 
     def test_risk_assessment_confidence_upper_bound(self) -> None:
         """Test that confidence must be <= 1.0."""
@@ -159,7 +173,7 @@ class TestRiskAssessment:
                 confidence=1.1,
                 explanation="Test",
             )
-        assert "confidence" in str(exc_info.value)
+        assert first_error_field(exc_info.value) == "confidence"
 
     def test_risk_assessment_confidence_at_bounds(self) -> None:
         """Test confidence at exact bounds (0.0 and 1.0)."""
@@ -179,36 +193,20 @@ class TestRiskAssessment:
         )
         assert risk_high.confidence == 1.0
 
-    def test_risk_assessment_default_issues(self) -> None:
-        """Test that issues defaults to empty list."""
-        risk = RiskAssessment(
-            clause_id="test",
-            risk_level=RiskLevel.LOW,
-            confidence=0.5,
-            explanation="Test",
-        )
-        assert risk.issues == []
+    @pytest.mark.parametrize(("attr", "expected"), [("issues", []), ("affected_party", "")])
+    def test_risk_assessment_defaults(
+        self, default_risk: RiskAssessment, attr: str, expected: object
+    ) -> None:
+        """Test that issues and affected_party default to empty values."""
+        assert getattr(default_risk, attr) == expected
 
-    def test_risk_assessment_default_affected_party(self) -> None:
-        """Test that affected_party defaults to empty string."""
-        risk = RiskAssessment(
-            clause_id="test",
-            risk_level=RiskLevel.LOW,
-            confidence=0.5,
-            explanation="Test",
-        )
-        assert risk.affected_party == ""
-
-    def test_risk_assessment_all_risk_levels(self) -> None:
+    @pytest.mark.parametrize("level", ALL_RISK_LEVELS, ids=[r.value for r in ALL_RISK_LEVELS])
+    def test_risk_assessment_all_risk_levels(self, level: RiskLevel) -> None:
         """Test that all RiskLevel values can be used."""
-        for level in RiskLevel:
-            risk = RiskAssessment(
-                clause_id="test",
-                risk_level=level,
-                confidence=0.5,
-                explanation="Test",
-            )
-            assert risk.risk_level == level
+        risk = _RISK_ADAPTER.validate_python(
+            {"clause_id": "test", "risk_level": level, "confidence": 0.5, "explanation": "Test"}
+        )
+        assert risk.risk_level == level
 
 
 class TestRecommendation:
@@ -239,7 +237,7 @@ class TestRecommendation:
                 action="Test",
                 rationale="Test",
             )
-        assert "priority" in str(exc_info.value)
+        assert first_error_field(exc_info.value) == "priority"
 
     def test_recommendation_priority_upper_bound(self) -> None:
         """Test that priority must be <= 5."""
@@ -250,7 +248,7 @@ class TestRecommendation:
                 action="Test",
                 rationale="Test",
             )
-        assert "priority" in str(exc_info.value)
+        assert first_error_field(exc_info.value) == "priority"
 
     def test_recommendation_priority_at_bounds(self) -> None:
         """Test priority at exact bounds (1 and 5)."""
@@ -281,20 +279,21 @@ class TestRecommendation:
         assert rec.suggested_text is None
         assert rec.risk_reduction is None
 
-    def test_recommendation_all_priority_levels(self) -> None:
+    @pytest.mark.parametrize("priority", range(1, 6))
+    def test_recommendation_all_priority_levels(self, priority: int) -> None:
         """Test all valid priority levels (1-5)."""
-        for priority in range(1, 6):
-            rec = Recommendation(
-                clause_id="test",
-                priority=priority,
-                action="Test",
-                rationale="Test",
-            )
-            assert rec.priority == priority
+        rec = _REC_ADAPTER.validate_python(
+            {"clause_id": "test", "priority": priority, "action": "Test", "rationale": "Test"}
+        )
+        assert rec.priority == priority
 
 
 class TestContractAnalysis:
-    """Tests for ContractAnalysis model."""
+    """Tests for ContractAnalysis model.
+
+    Nested clauses, risks and recommendations come from the shared read-only
+    sample fixtures; their validation is covered by the classes above.
+    """
 
     def test_contract_analysis_creation(self) -> None:
         """Test creating a ContractAnalysis."""
@@ -312,55 +311,57 @@ class TestContractAnalysis:
         assert analysis.missing_clauses == []
         assert analysis.metadata == {}
 
-    def test_contract_analysis_with_clauses(self) -> None:
+    def test_contract_analysis_with_clauses(self, sample_clause: ExtractedClause) -> None:
         """Test ContractAnalysis with clauses."""
-        clause = ExtractedClause(
-            id="c1",
-            type=ClauseType.LIABILITY,
-            title="Liability",
-            text="Test",
-            location="Section 1",
-        )
         analysis = ContractAnalysis(
             contract_id="test",
             summary="Test",
-            clauses=[clause],
+            clauses=[sample_clause],
             overall_risk=RiskLevel.LOW,
         )
         assert len(analysis.clauses) == 1
 
-    def test_contract_analysis_with_risks(self) -> None:
+    def test_contract_analysis_with_risks(self, sample_risk: RiskAssessment) -> None:
         """Test ContractAnalysis with risks."""
-        risk = RiskAssessment(
-            clause_id="c1",
-            risk_level=RiskLevel.HIGH,
-            confidence=0.9,
-            explanation="Test",
-        )
         analysis = ContractAnalysis(
             contract_id="test",
             summary="Test",
-            risks=[risk],
+            risks=[sample_risk],
             overall_risk=RiskLevel.HIGH,
         )
         assert len(analysis.risks) == 1
 
-    def test_contract_analysis_with_recommendations(self) -> None:
+    def test_contract_analysis_with_recommendations(
+        self, sample_recommendation: Recommendation
+    ) -> None:
         """Test ContractAnalysis with recommendations."""
-        rec = Recommendation(
-            clause_id="c1",
-            priority=1,
-            action="Fix it",
-            rationale="It's broken",
-        )
         analysis = ContractAnalysis(
             contract_id="test",
             summary="Test",
-            recommendations=[rec],
+            recommendations=[sample_recommendation],
             overall_risk=RiskLevel.MEDIUM,
         )
         assert len(analysis.recommendations) == 1
 
+    def test_contract_analysis_keeps_nested_instances(
+        self,
+        sample_clause: ExtractedClause,
+        sample_risk: RiskAssessment,
+        sample_recommendation: Recommendation,
+    ) -> None:
+        """Test that already-built nested models are stored without revalidation."""
+        analysis = ContractAnalysis(
+            contract_id="test",
+            summary="Test",
+            clauses=[sample_clause],
+            risks=[sample_risk],
+            recommendations=[sample_recommendation],
+            overall_risk=RiskLevel.HIGH,
+        )
+        assert analysis.clauses[0] is sample_clause
+        assert analysis.risks[0] is sample_risk
+        assert analysis.recommendations[0] is sample_recommendation
+
     def test_contract_analysis_with_missing_clauses(self) -> None:
         """Test ContractAnalysis with missing clauses."""
         analysis = ContractAnalysis(
@@ -372,33 +373,19 @@ class TestContractAnalysis:
         assert len(analysis.missing_clauses) == 2
         assert ClauseType.INDEMNIFICATION in analysis.missing_clauses
 
-    def test_contract_analysis_full(self) -> None:
+    def test_contract_analysis_full(
+        self,
+        sample_clause: ExtractedClause,
+        sample_risk: RiskAssessment,
+        sample_recommendation: Recommendation,
+    ) -> None:
         """Test ContractAnalysis with all fields populated."""
-        clause = ExtractedClause(
-            id="c1",
-            type=ClauseType.LIABILITY,
-            title="Liability",
-            text="Test",
-            location="Section 1",
-        )
-        risk = RiskAssessment(
-            clause_id="c1",
-            risk_level=RiskLevel.HIGH,
-            confidence=0.9,
-            explanation="Test",
-        )
-        rec = Recommendation(
-            clause_id="c1",
-            priority=1,
-            action="Fix",
-            rationale="Broken",
-        )
         analysis = ContractAnalysis(
             contract_id="full-test",
             summary="Complete analysis",
-            clauses=[clause],
-            risks=[risk],
-            recommendations=[rec],
+            clauses=[sample_clause],
+            risks=[sample_risk],
+            recommendations=[sample_recommendation],
             missing_clauses=[ClauseType.WARRANTY],
             overall_risk=RiskLevel.HIGH,
             metadata={"version": 1, "analyzed_by": "test"},
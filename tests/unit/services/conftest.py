@@ -0,0 +1,79 @@
+"""Shared fixtures for the service tests.
+
+The file parts are built once per session: parse_document only reads them.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from tests.fixtures.sample_files import (
+    SAMPLE_LATIN1_BASE64,
+    SAMPLE_TXT_BASE64,
+    SAMPLE_UNICODE_BASE64,
+    create_file_part,
+)
+
+MakePartFn = Callable[[str, str], dict[str, Any]]
+
+
+@pytest.fixture(scope="session")
+def make_part() -> MakePartFn:
+    """Build file parts holding SAMPLE_TXT_BASE64 from a MIME type and filename."""
+
+    def factory(mime_type: str, name: str) -> dict[str, Any]:
+        return create_file_part(mime_type, SAMPLE_TXT_BASE64, name)
+
+    return factory
+
+
+@pytest.fixture(scope="session")
+def empty_file_part() -> dict[str, Any]:
+    """Create a plain text file part with no content."""
+    return create_file_part(
+        mime_type="text/plain",
+        data_base64="",  # base64 of b""
+        name="empty.txt",
+    )
+
+
+@pytest.fixture(scope="session")
+def unicode_file_part() -> dict[str, Any]:
+    """Create a UTF-8 encoded text file part holding SAMPLE_UNICODE_TEXT."""
+    return create_file_part(
+        mime_type="text/plain",
+        data_base64=SAMPLE_UNICODE_BASE64,
+        name="unicode.txt",
+    )
+
+
+@pytest.fixture(scope="session")
+def latin1_file_part() -> dict[str, Any]:
+    """Create a Latin-1 encoded text file part holding SAMPLE_LATIN1_TEXT."""
+    return create_file_part(
+        mime_type="text/plain",
+        data_base64=SAMPLE_LATIN1_BASE64,
+        name="latin1.txt",
+    )
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        pytest.param(("application/pdf", "fake.pdf"), id="pdf"),
+        pytest.param(
+            (
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                "fake.docx",
+            ),
+            id="docx",
+        ),
+        pytest.param(("application/msword", "fake.doc"), id="msword"),
+    ],
+)
+def invalid_document_part(
+    request: pytest.FixtureRequest, make_part: MakePartFn
+) -> dict[str, Any]:
+    """Create a file part with a supported document MIME type but plain text content."""
+    return make_part(*request.param)
@@ -2,6 +2,8 @@
 
 import asyncio
 from datetime import datetime
+from types import MappingProxyType
+from uuid import UUID
 
 import pytest
 
@@ -19,40 +21,53 @@ from sae.services.task_manager import (
     get_task_manager,
 )
 
+from tests.fixtures.models import freeze
+
+# Shared initial message; TaskManager only stores it in task history.
+_USER_MSG = freeze(Message(role="user", parts=[TextPart(text="Test")]))
+
 
 class TestValidTransitions:
     """Tests for VALID_TRANSITIONS constant."""
 
-    def test_submitted_transitions(self) -> None:
-        """Test valid transitions from SUBMITTED state."""
-        assert VALID_TRANSITIONS[TaskState.SUBMITTED] == {
-            TaskState.WORKING,
-            TaskState.CANCELED,
-            TaskState.FAILED,
-        }
-
-    def test_working_transitions(self) -> None:
-        """Test valid transitions from WORKING state."""
-        assert VALID_TRANSITIONS[TaskState.WORKING] == {
-            TaskState.COMPLETED,
-            TaskState.FAILED,
-            TaskState.CANCELED,
-            TaskState.INPUT_REQUIRED,
-        }
-
-    def test_input_required_transitions(self) -> None:
-        """Test valid transitions from INPUT_REQUIRED state."""
-        assert VALID_TRANSITIONS[TaskState.INPUT_REQUIRED] == {
-            TaskState.WORKING,
-            TaskState.CANCELED,
-            TaskState.FAILED,
-        }
-
-    def test_terminal_states_have_no_transitions(self) -> None:
-        """Test that terminal states have no valid transitions."""
-        assert VALID_TRANSITIONS[TaskState.COMPLETED] == set()
-        assert VALID_TRANSITIONS[TaskState.FAILED] == set()
-        assert VALID_TRANSITIONS[TaskState.CANCELED] == set()
+    @pytest.mark.parametrize(
+        ("state", "expected"),
+        [
+            (
+                TaskState.SUBMITTED,
+                {TaskState.WORKING, TaskState.CANCELED, TaskState.FAILED},
+            ),
+            (
+                TaskState.WORKING,
+                {
+                    TaskState.COMPLETED,
+                    TaskState.FAILED,
+                    TaskState.CANCELED,
+                    TaskState.INPUT_REQUIRED,
+                },
+            ),
+            (
+                TaskState.INPUT_REQUIRED,
+                {TaskState.WORKING, TaskState.CANCELED, TaskState.FAILED},
+            ),
+            (TaskState.COMPLETED, set()),
+            (TaskState.FAILED, set()),
+            (TaskState.CANCELED, set()),
+        ],
+        ids=["submitted", "working", "input-required", "completed", "failed", "canceled"],
+    )
+    def test_transitions(self, state: TaskState, expected: set[TaskState]) -> None:
+        """Test the valid transitions out of each state (terminal states have none)."""
+        assert VALID_TRANSITIONS[state] == expected
+
+    def test_every_state_has_transitions(self) -> None:
+        """Test that every TaskState has an entry, so update_status can index the table."""
+        assert VALID_TRANSITIONS.keys() == set(TaskState)
+
+    def test_transitions_are_read_only(self) -> None:
+        """Test that the transition table and its target sets cannot be mutated."""
+        assert isinstance(VALID_TRANSITIONS, MappingProxyType)
+        assert all(isinstance(targets, frozenset) for targets in VALID_TRANSITIONS.values())
 
 
 class TestTaskManagerCreateTask:
@@ -60,23 +75,19 @@ class TestTaskManagerCreateTask:
 
     async def test_create_task_generates_id(self, task_manager: TaskManager) -> None:
         """Test that create_task generates a UUID when id is not provided."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
+        task = await task_manager.create_task(_USER_MSG)
 
-        assert task.id is not None
-        assert len(task.id) == 36  # UUID format
+        UUID(task.id)  # Raises ValueError if the id is not a UUID
 
     async def test_create_task_uses_provided_id(self, task_manager: TaskManager) -> None:
         """Test that create_task uses the provided task_id."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message, task_id="custom-id-123")
+        task = await task_manager.create_task(_USER_MSG, task_id="custom-id-123")
 
         assert task.id == "custom-id-123"
 
     async def test_create_task_initial_state_submitted(self, task_manager: TaskManager) -> None:
         """Test that new tasks start in SUBMITTED state."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
+        task = await task_manager.create_task(_USER_MSG)
 
         assert task.status.state == TaskState.SUBMITTED
 
@@ -91,9 +102,8 @@ class TestTaskManagerCreateTask:
 
     async def test_create_task_with_metadata(self, task_manager: TaskManager) -> None:
         """Test that metadata is stored correctly."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
         task = await task_manager.create_task(
-            message,
+            _USER_MSG,
             metadata={"source": "api", "priority": 1},
         )
 
@@ -118,14 +128,28 @@ class TestTaskManagerCreateTask:
         assert task1.history[0].parts[0].text == "First message"  # type: ignore
         assert task1.history[1].parts[0].text == "Second message"  # type: ignore
 
-    async def test_create_task_sets_timestamp(self, task_manager: TaskManager) -> None:
-        """Test that task creation sets a timestamp."""
-        before = datetime.utcnow()
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        after = datetime.utcnow()
+    async def test_bulk_create(self, task_manager: TaskManager) -> None:
+        """Test that bulk_create creates every task in order and appends to existing ones."""
+        await task_manager.create_task(_USER_MSG, task_id="bulk-1")
+
+        tasks = await task_manager.bulk_create(
+            [("bulk-1", _USER_MSG), ("bulk-2", _USER_MSG), ("bulk-3", _USER_MSG)]
+        )
 
-        assert before <= task.status.timestamp <= after
+        assert [task.id for task in tasks] == ["bulk-1", "bulk-2", "bulk-3"]
+        assert len(tasks[0].history) == 2
+        assert all(task.status.state == TaskState.SUBMITTED for task in tasks)
+
+    async def test_create_task_sets_timestamp(
+        self, task_manager: TaskManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that task creation stamps the status with the current time."""
+        now = datetime(2026, 1, 1, 12, 0, 0)
+        monkeypatch.setattr("sae.services.task_manager._utcnow", lambda: now)
+
+        task = await task_manager.create_task(_USER_MSG)
+
+        assert task.status.timestamp == now
 
 
 class TestTaskManagerGetTask:
@@ -133,8 +157,7 @@ class TestTaskManagerGetTask:
 
     async def test_get_task_success(self, task_manager: TaskManager) -> None:
         """Test getting an existing task."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        created_task = await task_manager.create_task(message, task_id="get-test")
+        created_task = await task_manager.create_task(_USER_MSG, task_id="get-test")
 
         retrieved_task = await task_manager.get_task("get-test")
 
@@ -151,104 +174,60 @@ class TestTaskManagerGetTask:
 class TestTaskManagerUpdateStatus:
     """Tests for TaskManager.update_status method."""
 
-    async def test_valid_transition_submitted_to_working(
-        self, task_manager: TaskManager
-    ) -> None:
-        """Test SUBMITTED -> WORKING transition."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-
-        updated = await task_manager.update_status(task.id, TaskState.WORKING)
-
-        assert updated.status.state == TaskState.WORKING
-
-    async def test_valid_transition_working_to_completed(
-        self, task_manager: TaskManager
-    ) -> None:
-        """Test WORKING -> COMPLETED transition."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        await task_manager.update_status(task.id, TaskState.WORKING)
-
-        updated = await task_manager.update_status(task.id, TaskState.COMPLETED)
-
-        assert updated.status.state == TaskState.COMPLETED
-
-    async def test_valid_transition_working_to_failed(
-        self, task_manager: TaskManager
-    ) -> None:
-        """Test WORKING -> FAILED transition."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        await task_manager.update_status(task.id, TaskState.WORKING)
-
-        updated = await task_manager.update_status(task.id, TaskState.FAILED)
-
-        assert updated.status.state == TaskState.FAILED
-
-    async def test_valid_transition_working_to_canceled(
-        self, task_manager: TaskManager
-    ) -> None:
-        """Test WORKING -> CANCELED transition."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        await task_manager.update_status(task.id, TaskState.WORKING)
-
-        updated = await task_manager.update_status(task.id, TaskState.CANCELED)
-
-        assert updated.status.state == TaskState.CANCELED
-
-    async def test_valid_transition_working_to_input_required(
-        self, task_manager: TaskManager
-    ) -> None:
-        """Test WORKING -> INPUT_REQUIRED transition."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        await task_manager.update_status(task.id, TaskState.WORKING)
-
-        updated = await task_manager.update_status(task.id, TaskState.INPUT_REQUIRED)
-
-        assert updated.status.state == TaskState.INPUT_REQUIRED
-
-    async def test_invalid_transition_completed_to_working(
-        self, task_manager: TaskManager
-    ) -> None:
-        """Test that COMPLETED -> WORKING is rejected."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        await task_manager.update_status(task.id, TaskState.WORKING)
-        await task_manager.update_status(task.id, TaskState.COMPLETED)
-
-        with pytest.raises(InvalidStateTransitionError):
-            await task_manager.update_status(task.id, TaskState.WORKING)
-
-    async def test_invalid_transition_failed_to_completed(
-        self, task_manager: TaskManager
+    @pytest.mark.parametrize(
+        "path",
+        [
+            [TaskState.WORKING],
+            [TaskState.WORKING, TaskState.COMPLETED],
+            [TaskState.WORKING, TaskState.FAILED],
+            [TaskState.WORKING, TaskState.CANCELED],
+            [TaskState.WORKING, TaskState.INPUT_REQUIRED],
+        ],
+        ids=[
+            "submitted-to-working",
+            "working-to-completed",
+            "working-to-failed",
+            "working-to-canceled",
+            "working-to-input_required",
+        ],
+    )
+    async def test_valid_transition(
+        self, task_manager: TaskManager, path: list[TaskState]
     ) -> None:
-        """Test that FAILED -> COMPLETED is rejected."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        await task_manager.update_status(task.id, TaskState.WORKING)
-        await task_manager.update_status(task.id, TaskState.FAILED)
-
-        with pytest.raises(InvalidStateTransitionError):
-            await task_manager.update_status(task.id, TaskState.COMPLETED)
-
-    async def test_invalid_transition_canceled_to_working(
-        self, task_manager: TaskManager
+        """Test that each step along a valid path is accepted."""
+        task = await task_manager.create_task(_USER_MSG)
+
+        for state in path:
+            updated = await task_manager.update_status(task.id, state)
+
+        assert updated.status.state == path[-1]
+
+    @pytest.mark.parametrize(
+        ("setup_path", "bad_target"),
+        [
+            ([TaskState.WORKING, TaskState.COMPLETED], TaskState.WORKING),
+            ([TaskState.WORKING, TaskState.FAILED], TaskState.COMPLETED),
+            ([TaskState.CANCELED], TaskState.WORKING),
+        ],
+        ids=["completed-to-working", "failed-to-completed", "canceled-to-working"],
+    )
+    async def test_invalid_transition(
+        self,
+        task_manager: TaskManager,
+        setup_path: list[TaskState],
+        bad_target: TaskState,
     ) -> None:
-        """Test that CANCELED -> WORKING is rejected."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        await task_manager.update_status(task.id, TaskState.CANCELED)
+        """Test that transitions out of a terminal state are rejected."""
+        task = await task_manager.create_task(_USER_MSG)
+        for state in setup_path:
+            await task_manager.update_status(task.id, state)
 
         with pytest.raises(InvalidStateTransitionError):
-            await task_manager.update_status(task.id, TaskState.WORKING)
+            await task_manager.update_status(task.id, bad_target)
 
     async def test_update_status_with_message(self, task_manager: TaskManager) -> None:
         """Test that status update can include a message."""
-        user_msg = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(user_msg)
+        task = await task_manager.create_task(_USER_MSG)
 
         status_msg = Message(
             role="agent",
@@ -268,14 +247,14 @@ class TestTaskManagerUpdateStatus:
             await task_manager.update_status("non-existent", TaskState.WORKING)
 
     async def test_update_status_updates_timestamp(
-        self, task_manager: TaskManager
+        self, task_manager: TaskManager, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test that update_status updates the timestamp."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        original_timestamp = task.status.timestamp
+        clock = iter([datetime(2026, 1, 1, 12, 0, 0), datetime(2026, 1, 1, 12, 0, 1)])
+        monkeypatch.setattr("sae.services.task_manager._utcnow", lambda: next(clock))
 
-        await asyncio.sleep(0.01)  # Small delay to ensure different timestamp
+        task = await task_manager.create_task(_USER_MSG)
+        original_timestamp = task.status.timestamp
 
         updated = await task_manager.update_status(task.id, TaskState.WORKING)
 
@@ -287,8 +266,7 @@ class TestTaskManagerAddArtifact:
 
     async def test_add_artifact_success(self, task_manager: TaskManager) -> None:
         """Test adding an artifact to a task."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
+        task = await task_manager.create_task(_USER_MSG)
 
         artifact = Artifact(
             name="report",
@@ -302,8 +280,7 @@ class TestTaskManagerAddArtifact:
 
     async def test_add_artifact_increments_index(self, task_manager: TaskManager) -> None:
         """Test that artifact index is auto-incremented."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
+        task = await task_manager.create_task(_USER_MSG)
 
         artifact1 = Artifact(name="first", parts=[TextPart(text="First")])
         artifact2 = Artifact(name="second", parts=[TextPart(text="Second")])
@@ -326,55 +303,58 @@ class TestTaskManagerAddArtifact:
 class TestTaskManagerConvenienceMethods:
     """Tests for TaskManager convenience methods."""
 
-    async def test_cancel_task_success(self, task_manager: TaskManager) -> None:
-        """Test cancel_task transitions to CANCELED state."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
+    @pytest.mark.parametrize(
+        ("method", "args", "from_working", "final", "status_text"),
+        [
+            ("cancel_task", (), False, TaskState.CANCELED, "Task was canceled by request."),
+            (
+                "fail_task",
+                ("Something went wrong",),
+                True,
+                TaskState.FAILED,
+                "Task failed: Something went wrong",
+            ),
+            ("complete_task", (), True, TaskState.COMPLETED, None),
+        ],
+        ids=["cancel", "fail", "complete"],
+    )
+    async def test_terminal_convenience_method(
+        self,
+        task_manager: TaskManager,
+        method: str,
+        args: tuple[str, ...],
+        from_working: bool,
+        final: TaskState,
+        status_text: str | None,
+    ) -> None:
+        """Test that each convenience method moves the task to its terminal state."""
+        task = await task_manager.create_task(_USER_MSG)
+        if from_working:
+            await task_manager.update_status(task.id, TaskState.WORKING)
 
-        canceled = await task_manager.cancel_task(task.id)
+        updated = await getattr(task_manager, method)(task.id, *args)
 
-        assert canceled.status.state == TaskState.CANCELED
-        assert canceled.status.message is not None
-        assert "canceled" in canceled.status.message.parts[0].text.lower()  # type: ignore
+        assert updated.status.state == final
+        if status_text is None:
+            assert updated.status.message is None
+        else:
+            assert updated.status.message is not None
+            assert updated.status.message.parts[0].text == status_text  # type: ignore
 
     async def test_cancel_task_from_terminal_fails(
         self, task_manager: TaskManager
     ) -> None:
         """Test that canceling a completed task raises error."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
+        task = await task_manager.create_task(_USER_MSG)
         await task_manager.update_status(task.id, TaskState.WORKING)
         await task_manager.update_status(task.id, TaskState.COMPLETED)
 
         with pytest.raises(InvalidStateTransitionError):
             await task_manager.cancel_task(task.id)
 
-    async def test_fail_task_success(self, task_manager: TaskManager) -> None:
-        """Test fail_task transitions to FAILED state."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        await task_manager.update_status(task.id, TaskState.WORKING)
-
-        failed = await task_manager.fail_task(task.id, "Something went wrong")
-
-        assert failed.status.state == TaskState.FAILED
-        assert failed.status.message is not None
-        assert "Something went wrong" in failed.status.message.parts[0].text  # type: ignore
-
-    async def test_complete_task_success(self, task_manager: TaskManager) -> None:
-        """Test complete_task transitions to COMPLETED state."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
-        await task_manager.update_status(task.id, TaskState.WORKING)
-
-        completed = await task_manager.complete_task(task.id)
-
-        assert completed.status.state == TaskState.COMPLETED
-
     async def test_complete_task_with_message(self, task_manager: TaskManager) -> None:
         """Test complete_task with a completion message."""
-        user_msg = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(user_msg)
+        task = await task_manager.create_task(_USER_MSG)
         await task_manager.update_status(task.id, TaskState.WORKING)
 
         completion_msg = Message(
@@ -393,37 +373,36 @@ class TestTaskManagerSubscribe:
         self, task_manager: TaskManager
     ) -> None:
         """Test that subscribe yields the initial task state."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
+        task = await task_manager.create_task(_USER_MSG)
 
-        results = []
-        async for result in task_manager.subscribe(task.id):
-            results.append(result)
-            # Cancel the task to end the subscription
-            await task_manager.cancel_task(task.id)
-            break
+        subscription = task_manager.subscribe(task.id)
+        first = await anext(subscription)
+        # Cancel the task, then close the generator so it unregisters right away
+        await task_manager.cancel_task(task.id)
+        await subscription.aclose()
 
-        assert len(results) >= 1
-        assert results[0].status.state == TaskState.SUBMITTED
+        assert first.status.state == TaskState.SUBMITTED
+        assert not task_manager._subscribers[task.id]
 
     async def test_subscribe_receives_updates(self, task_manager: TaskManager) -> None:
         """Test that subscription receives state updates."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
+        task = await task_manager.create_task(_USER_MSG)
 
         results = []
+        started = asyncio.Event()
 
         async def subscribe_and_collect() -> None:
             async for result in task_manager.subscribe(task.id):
                 results.append(result)
+                started.set()
                 if result.status.state == TaskState.COMPLETED:
                     break
 
         # Start subscription in background
         subscription_task = asyncio.create_task(subscribe_and_collect())
 
-        # Give subscription time to start
-        await asyncio.sleep(0.01)
+        # The initial state is yielded once the subscriber queue is registered
+        await started.wait()
 
         # Update task status
         await task_manager.update_status(task.id, TaskState.WORKING)
@@ -448,17 +427,18 @@ class TestTaskManagerSubscribe:
         self, task_manager: TaskManager
     ) -> None:
         """Test that subscription stops after terminal state."""
-        message = Message(role="user", parts=[TextPart(text="Test")])
-        task = await task_manager.create_task(message)
+        task = await task_manager.create_task(_USER_MSG)
 
         results = []
+        started = asyncio.Event()
 
         async def subscribe_and_collect() -> None:
             async for result in task_manager.subscribe(task.id):
                 results.append(result)
+                started.set()
 
         subscription_task = asyncio.create_task(subscribe_and_collect())
-        await asyncio.sleep(0.01)
+        await started.wait()
 
         await task_manager.update_status(task.id, TaskState.WORKING)
         await task_manager.update_status(task.id, TaskState.FAILED)
@@ -473,39 +453,34 @@ class TestTaskManagerSubscribe:
 class TestTaskManagerListTasks:
     """Tests for TaskManager.list_tasks method."""
 
-    async def test_list_tasks_returns_all(self, task_manager: TaskManager) -> None:
-        """Test that list_tasks returns all tasks."""
-        msg = Message(role="user", parts=[TextPart(text="Test")])
-        await task_manager.create_task(msg, task_id="task-1")
-        await task_manager.create_task(msg, task_id="task-2")
-        await task_manager.create_task(msg, task_id="task-3")
+    @pytest.fixture(scope="class")
+    async def populated_manager(self) -> TaskManager:
+        """Create a TaskManager holding nine submitted tasks and one working task.
 
-        tasks = await task_manager.list_tasks()
-
-        assert len(tasks) == 3
+        The tests below only read from it, so it is built once for the class.
+        """
+        manager = TaskManager()
+        await manager.bulk_create([(f"task-{i}", _USER_MSG) for i in range(10)])
+        await manager.update_status("task-9", TaskState.WORKING)
+        return manager
 
-    async def test_list_tasks_filter_by_state(self, task_manager: TaskManager) -> None:
-        """Test filtering tasks by state."""
-        msg = Message(role="user", parts=[TextPart(text="Test")])
-        await task_manager.create_task(msg, task_id="submitted-1")
-        await task_manager.create_task(msg, task_id="submitted-2")
+    async def test_list_tasks_returns_all(self, populated_manager: TaskManager) -> None:
+        """Test that list_tasks returns all tasks."""
+        tasks = await populated_manager.list_tasks()
 
-        task3 = await task_manager.create_task(msg, task_id="working-1")
-        await task_manager.update_status(task3.id, TaskState.WORKING)
+        assert len(tasks) == 10
 
-        submitted_tasks = await task_manager.list_tasks(state=TaskState.SUBMITTED)
-        working_tasks = await task_manager.list_tasks(state=TaskState.WORKING)
+    async def test_list_tasks_filter_by_state(self, populated_manager: TaskManager) -> None:
+        """Test filtering tasks by state."""
+        submitted_tasks = await populated_manager.list_tasks(state=TaskState.SUBMITTED)
+        working_tasks = await populated_manager.list_tasks(state=TaskState.WORKING)
 
-        assert len(submitted_tasks) == 2
-        assert len(working_tasks) == 1
+        assert len(submitted_tasks) == 9
+        assert [task.id for task in working_tasks] == ["task-9"]
 
-    async def test_list_tasks_respects_limit(self, task_manager: TaskManager) -> None:
+    async def test_list_tasks_respects_limit(self, populated_manager: TaskManager) -> None:
         """Test that list_tasks respects the limit parameter."""
-        msg = Message(role="user", parts=[TextPart(text="Test")])
-        for i in range(10):
-            await task_manager.create_task(msg, task_id=f"task-{i}")
-
-        tasks = await task_manager.list_tasks(limit=5)
+        tasks = await populated_manager.list_tasks(limit=5)
 
         assert len(tasks) == 5
 
@@ -518,13 +493,13 @@ class TestTaskManagerListTasks:
 class TestGetTaskManager:
     """Tests for get_task_manager singleton function."""
 
+    @pytest.fixture(autouse=True)
+    def reset_global_manager(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Start each test without a global instance and restore the original afterwards."""
+        monkeypatch.setattr("sae.services.task_manager._task_manager", None)
+
     def test_get_task_manager_returns_instance(self) -> None:
         """Test that get_task_manager returns a TaskManager instance."""
-        # Reset the global instance for testing
-        import sae.services.task_manager as tm_module
-
-        tm_module._task_manager = None
-
         manager = get_task_manager()
         assert isinstance(manager, TaskManager)
 
@@ -540,38 +515,47 @@ class TestTaskManagerConcurrency:
 
     async def test_concurrent_task_creation(self, task_manager: TaskManager) -> None:
         """Test that concurrent task creation is safe."""
+        task_ids = {f"concurrent-{i}" for i in range(200)}
 
-        async def create_task(task_id: str) -> None:
-            msg = Message(role="user", parts=[TextPart(text=f"Task {task_id}")])
-            await task_manager.create_task(msg, task_id=task_id)
-
-        # Create 20 tasks concurrently
-        tasks = [create_task(f"concurrent-{i}") for i in range(20)]
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            for task_id in task_ids:
+                tg.create_task(task_manager.create_task(_USER_MSG, task_id=task_id))
 
-        # All tasks should be created
-        all_tasks = await task_manager.list_tasks()
-        assert len(all_tasks) == 20
+        # All tasks should be created (list_tasks caps at 100 by default)
+        all_tasks = await task_manager.list_tasks(limit=len(task_ids))
+        assert {task.id for task in all_tasks} == task_ids
 
     async def test_concurrent_status_updates(self, task_manager: TaskManager) -> None:
         """Test that concurrent status updates are safe."""
-        msg = Message(role="user", parts=[TextPart(text="Test")])
-
-        # Create multiple tasks
-        task_ids = []
-        for i in range(10):
-            task = await task_manager.create_task(msg, task_id=f"update-{i}")
-            task_ids.append(task.id)
+        task_ids = [f"update-{i}" for i in range(200)]
+        await task_manager.bulk_create([(task_id, _USER_MSG) for task_id in task_ids])
 
         async def update_task(task_id: str) -> None:
             await task_manager.update_status(task_id, TaskState.WORKING)
             await task_manager.update_status(task_id, TaskState.COMPLETED)
 
-        # Update all tasks concurrently
-        tasks = [update_task(tid) for tid in task_ids]
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            for task_id in task_ids:
+                tg.create_task(update_task(task_id))
 
         # All tasks should be completed
         for task_id in task_ids:
             task = await task_manager.get_task(task_id)
             assert task.status.state == TaskState.COMPLETED
+
+    async def test_update_not_blocked_by_other_shard(self, task_manager: TaskManager) -> None:
+        """Test that holding one task's lock does not block a task on another shard."""
+        held_id = "held"
+        other_id = next(
+            task_id
+            for task_id in (f"other-{i}" for i in range(100))
+            if task_manager._lock_for(task_id) is not task_manager._lock_for(held_id)
+        )
+        await task_manager.bulk_create([(held_id, _USER_MSG), (other_id, _USER_MSG)])
+
+        async with task_manager._lock_for(held_id):
+            updated = await asyncio.wait_for(
+                task_manager.update_status(other_id, TaskState.WORKING), timeout=1.0
+            )
+
+        assert updated.status.state == TaskState.WORKING
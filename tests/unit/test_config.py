@@ -1,163 +1,172 @@
 """Tests for application configuration."""
 
-import os
-from unittest.mock import patch
+from collections.abc import Callable, Iterator, Mapping
+from types import MappingProxyType
+from typing import Any
 
 import pytest
-from pydantic import ValidationError
 
 from sae.config import Settings, get_settings
 
+SetEnv = Callable[..., None]
+
+_HINTS = Settings.__annotations__
+
+# Minimum environment a valid Settings needs.
+_MIN_ENV: Mapping[str, str] = MappingProxyType({"OPENAI_API_KEY": "test-key"})
+
+# An environment that overrides every field test_settings_from_env checks.
+_FULL_ENV: Mapping[str, str] = MappingProxyType(
+    {
+        "OPENAI_API_KEY": "test-openai-key",
+        "PINECONE_API_KEY": "test-pinecone-key",
+        "PINECONE_INDEX_NAME": "test-index",
+        "LOG_LEVEL": "DEBUG",
+        "ENVIRONMENT": "development",
+        "HOST": "127.0.0.1",
+        "PORT": "9000",
+        "AGENT_NAME": "Test Agent",
+        "AGENT_VERSION": "1.0.0",
+        "AGENT_DESCRIPTION": "Test description",
+    }
+)
+
+
+def build_settings(**overrides: Any) -> Settings:
+    """Build Settings from the process environment, skipping the .env file."""
+    return Settings(_env_file=None, **overrides)
+
+
+def setenv_many(mp: pytest.MonkeyPatch, env: Mapping[str, str]) -> None:
+    """Set every variable in env through mp so it is undone with the patch."""
+    for key, value in env.items():
+        mp.setenv(key, value)
+
+
+@pytest.fixture(autouse=True)
+def no_dotenv(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stop Settings, including the one get_settings() builds, from reading a .env file."""
+    monkeypatch.setitem(Settings.model_config, "env_file", None)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def apply_base_env() -> Iterator[None]:
+    """Set the base environment once for the module and restore it afterwards.
+
+    Tests that need a different value override it with their own monkeypatch,
+    which is undone before the next test runs.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        setenv_many(mp, _MIN_ENV)
+        yield
+
+
+@pytest.fixture(scope="module")
+def minimal_settings() -> Iterator[Settings]:
+    """Build one Settings from only the base environment, shared by read-only tests.
+
+    Variables for every other field are removed first, so the instance holds
+    the declared defaults whatever the surrounding environment sets.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for name in Settings.model_fields:
+            mp.delenv(name.upper(), raising=False)
+        setenv_many(mp, _MIN_ENV)
+        yield build_settings()
+
+
+@pytest.fixture
+def set_env(monkeypatch: pytest.MonkeyPatch) -> SetEnv:
+    """Set the given variables on top of the base environment for the current test."""
+
+    def apply(**delta: str) -> None:
+        setenv_many(monkeypatch, delta)
+
+    return apply
+
 
 class TestSettings:
     """Tests for Settings class."""
 
-    def test_settings_from_env(self) -> None:
+    def test_settings_from_env(self, set_env: SetEnv) -> None:
         """Test that settings can be loaded from environment variables."""
-        env_vars = {
-            "OPENAI_API_KEY": "test-openai-key",
-            "PINECONE_API_KEY": "test-pinecone-key",
-            "PINECONE_INDEX_NAME": "test-index",
-            "LOG_LEVEL": "DEBUG",
-            "ENVIRONMENT": "development",
-            "HOST": "127.0.0.1",
-            "PORT": "9000",
-            "AGENT_NAME": "Test Agent",
-            "AGENT_VERSION": "1.0.0",
-            "AGENT_DESCRIPTION": "Test description",
-        }
-        with patch.dict(os.environ, env_vars, clear=False):
-            settings = Settings()
-            assert settings.openai_api_key == "test-openai-key"
-            assert settings.pinecone_api_key == "test-pinecone-key"
-            assert settings.pinecone_index_name == "test-index"
-            assert settings.log_level == "DEBUG"
-            assert settings.environment == "development"
-            assert settings.host == "127.0.0.1"
-            assert settings.port == 9000
-            assert settings.agent_name == "Test Agent"
-            assert settings.agent_version == "1.0.0"
-
-    def test_settings_default_values(self) -> None:
+        set_env(**_FULL_ENV)
+
+        settings = build_settings()
+        assert settings.openai_api_key == "test-openai-key"
+        assert settings.pinecone_api_key == "test-pinecone-key"
+        assert settings.pinecone_index_name == "test-index"
+        assert settings.log_level == "DEBUG"
+        assert settings.environment == "development"
+        assert settings.host == "127.0.0.1"
+        assert settings.port == 9000
+        assert settings.agent_name == "Test Agent"
+        assert settings.agent_version == "1.0.0"
+
+    def test_settings_default_values(self, minimal_settings: Settings) -> None:
         """Test that settings have correct default values when not overridden."""
-        env_vars = {
-            "OPENAI_API_KEY": "test-key",
-            "PINECONE_API_KEY": "test-pinecone-key",
-            # Explicitly set values to test defaults
-            "LOG_LEVEL": "INFO",
-            "ENVIRONMENT": "development",
-        }
-        with patch.dict(os.environ, env_vars, clear=False):
-            settings = Settings()
-            assert settings.pinecone_index_name == "sae-legal"
-            assert settings.log_level == "INFO"
-            assert settings.environment == "development"
-            assert settings.host == "0.0.0.0"
-            assert settings.port == 8000
-            assert settings.agent_name == "Sae Legal Agent"
-            assert settings.agent_version == "0.1.0"
-            assert settings.agent_description == "Contract clause review and risk analysis"
+        assert minimal_settings.pinecone_api_key is None
+        assert minimal_settings.pinecone_index_name == "sae-legal"
+        assert minimal_settings.api_key is None
+        assert minimal_settings.log_level == "INFO"
+        assert minimal_settings.environment == "development"
+        assert minimal_settings.host == "0.0.0.0"
+        assert minimal_settings.port == 8000
+        assert minimal_settings.agent_name == "Sae Legal Agent"
+        assert minimal_settings.agent_version == "0.1.0"
+        assert minimal_settings.agent_description == "Contract clause review and risk analysis"
 
     def test_settings_fields_are_required(self) -> None:
         """Test that openai_api_key is required, pinecone is optional."""
-        hints = Settings.__annotations__
         # openai_api_key should be str (required)
-        assert hints["openai_api_key"] == str
+        assert _HINTS["openai_api_key"] is str
         # pinecone_api_key should be optional (str | None)
-        assert hints["pinecone_api_key"] == (str | None)
+        assert _HINTS["pinecone_api_key"] == (str | None)
         # api_key should be optional (str | None)
-        assert hints["api_key"] == (str | None)
+        assert _HINTS["api_key"] == (str | None)
 
     def test_settings_new_optional_fields(self) -> None:
         """Test new optional configuration fields and their defaults."""
-        # Test that these fields have correct default types/values
-        # Note: actual .env file may override defaults, so we test structure
-        env_vars = {
-            "OPENAI_API_KEY": "test-key",
-            # Explicitly unset optional fields to test defaults
-            "PINECONE_API_KEY": "",
-            "API_KEY": "",
-        }
-        with patch.dict(os.environ, env_vars, clear=False):
-            # Create settings without loading .env file
-            from pydantic_settings import BaseSettings, SettingsConfigDict
-
-            # Test defaults by checking field annotations exist
-            hints = Settings.__annotations__
-            assert "pinecone_api_key" in hints
-            assert "api_key" in hints
-            assert "rate_limit_enabled" in hints
-            assert "rate_limit_per_minute" in hints
-            assert "cors_origins" in hints
-
-            # Test rate limit defaults (not affected by .env)
-            settings = Settings()
-            assert settings.rate_limit_enabled is True
-            assert settings.rate_limit_per_minute == 30
-            assert settings.cors_origins == ["*"]
-
-    def test_settings_is_production_true(self) -> None:
-        """Test is_production property returns True for production."""
-        env_vars = {
-            "OPENAI_API_KEY": "test-key",
-            "ENVIRONMENT": "production",
-        }
-        with patch.dict(os.environ, env_vars, clear=False):
-            settings = Settings()
-            assert settings.is_production is True
-
-    def test_settings_is_production_false_development(self) -> None:
-        """Test is_production property returns False for development."""
-        env_vars = {
-            "OPENAI_API_KEY": "test-key",
-            "ENVIRONMENT": "development",
-        }
-        with patch.dict(os.environ, env_vars, clear=False):
-            settings = Settings()
-            assert settings.is_production is False
-
-    def test_settings_is_production_false_staging(self) -> None:
-        """Test is_production property returns False for staging."""
-        env_vars = {
-            "OPENAI_API_KEY": "test-key",
-            "ENVIRONMENT": "staging",
-        }
-        with patch.dict(os.environ, env_vars, clear=False):
-            settings = Settings()
-            assert settings.is_production is False
-
-    def test_settings_log_level_validation(self) -> None:
+        # Test defaults by checking field annotations exist
+        assert "pinecone_api_key" in _HINTS
+        assert "api_key" in _HINTS
+        assert "rate_limit_enabled" in _HINTS
+        assert "rate_limit_per_minute" in _HINTS
+        assert "cors_origins" in _HINTS
+
+        # Test rate limit defaults from the class-level field metadata
+        fields = Settings.model_fields
+        assert fields["rate_limit_enabled"].default is True
+        assert fields["rate_limit_per_minute"].default == 30
+        assert fields["cors_origins"].get_default(call_default_factory=True) == ["*"]
+
+    @pytest.mark.parametrize(
+        ("env", "expected"),
+        [("production", True), ("development", False), ("staging", False)],
+    )
+    def test_settings_is_production(self, set_env: SetEnv, env: str, expected: bool) -> None:
+        """Test that is_production is True only for the production environment."""
+        set_env(ENVIRONMENT=env)
+        assert build_settings().is_production is expected
+
+    @pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR"])
+    def test_settings_log_level_validation(self, set_env: SetEnv, level: str) -> None:
         """Test that log_level accepts valid values."""
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
-        for level in valid_levels:
-            env_vars = {
-                "OPENAI_API_KEY": "test-key",
-                "LOG_LEVEL": level,
-            }
-            with patch.dict(os.environ, env_vars, clear=False):
-                settings = Settings()
-                assert settings.log_level == level
-
-    def test_settings_environment_validation(self) -> None:
+        set_env(LOG_LEVEL=level)
+        assert build_settings().log_level == level
+
+    @pytest.mark.parametrize("env", ["development", "staging", "production"])
+    def test_settings_environment_validation(self, set_env: SetEnv, env: str) -> None:
         """Test that environment accepts valid values."""
-        valid_envs = ["development", "staging", "production"]
-        for env in valid_envs:
-            env_vars = {
-                "OPENAI_API_KEY": "test-key",
-                "ENVIRONMENT": env,
-            }
-            with patch.dict(os.environ, env_vars, clear=False):
-                settings = Settings()
-                assert settings.environment == env
-
-    def test_settings_case_insensitive(self) -> None:
+        set_env(ENVIRONMENT=env)
+        assert build_settings().environment == env
+
+    def test_settings_case_insensitive(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test that environment variable names are case insensitive."""
-        env_vars = {
-            "openai_api_key": "test-key",
-        }
-        with patch.dict(os.environ, env_vars, clear=False):
-            settings = Settings()
-            assert settings.openai_api_key == "test-key"
+        monkeypatch.delenv("OPENAI_API_KEY")
+        monkeypatch.setenv("openai_api_key", "lower-case-key")
+        settings = build_settings()
+        assert settings.openai_api_key == "lower-case-key"
 
 
 class TestGetSettings:
@@ -165,23 +174,18 @@ class TestGetSettings:
 
     def test_get_settings_returns_settings_instance(self) -> None:
         """Test that get_settings returns a Settings instance."""
-        env_vars = {
-            "OPENAI_API_KEY": "test-key",
-        }
-        with patch.dict(os.environ, env_vars, clear=False):
-            # Clear the cache to test fresh settings creation
-            get_settings.cache_clear()
-            settings = get_settings()
-            assert isinstance(settings, Settings)
+        # Clear the cache to test fresh settings creation
+        get_settings.cache_clear()
+        settings = get_settings()
+        assert isinstance(settings, Settings)
 
     def test_get_settings_cached(self) -> None:
         """Test that get_settings returns cached instance."""
-        env_vars = {
-            "OPENAI_API_KEY": "test-key",
-        }
-        with patch.dict(os.environ, env_vars, clear=False):
-            get_settings.cache_clear()
-            settings1 = get_settings()
-            settings2 = get_settings()
-            # Should be the exact same object (cached)
-            assert settings1 is settings2
+        get_settings.cache_clear()
+        settings1 = get_settings()
+        assert get_settings.cache_info().currsize == 1
+
+        settings2 = get_settings()
+        # Second call is a cache hit returning the exact same object
+        assert get_settings.cache_info().hits == 1
+        assert settings1 is settings2